@@ -23,7 +23,7 @@ warnings.filterwarnings('ignore')
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from scripts.utils.strategy_selector import select_strategy_from_features, validate_strategy_distribution
+from scripts.utils.strategy_selector import select_strategy_batch, validate_strategy_distribution
 
 
 # ============================================================================
@@ -32,7 +32,8 @@ from scripts.utils.strategy_selector import select_strategy_from_features, valid
 # Strategy selection logic moved to scripts/utils/strategy_selector.py
 # This keeps the code modular and maintainable
 # 
-# The select_strategy_from_features() function is imported from the module above
+# select_strategy_batch() (the vectorized select_strategy_from_features()) is
+# imported from the module above and labels every day in one pass
 # See scripts/utils/strategy_selector.py for implementation details
 
 
@@ -496,6 +497,9 @@ def create_labels(features_path, raw_data_path, output_path):
     print("Creating labels...")
     all_labels = []
     
+    # Step 1 for all days at once (vectorized rules engine)
+    strategies = select_strategy_batch(features_df)
+    
     # Skip first 30 days (need history for similarity matching)
     for idx, row in features_df.iloc[30:].iterrows():
         if idx % 50 == 0:
@@ -504,7 +508,7 @@ def create_labels(features_path, raw_data_path, output_path):
         features = row.to_dict()
         
         # Step 1: Select strategy
-        strategy = select_strategy_from_features(features)
+        strategy = strategies[idx]
         
         # NO FALLBACK: If no strategy matches, skip this day
         if strategy is None:
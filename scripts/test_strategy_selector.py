@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Strategy Selector Regression Test
+=================================
+
+The rules cascade that labels the training data exists twice in each
+selector module: the compiled kernel (_select_strategy_nb, run per row and by
+select_strategy_batch when Numba is installed) and the NumPy mask version
+(_select_masked, used when it is not). This checks that they agree with each
+other and with the per-row API on a grid of every rule threshold, one step
+either side of it, and NaN, for every feature.
+
+Run after changing any rule in either module:
+    python scripts/test_strategy_selector.py
+"""
+
+import sys
+import os
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.utils import strategy_selector, strategy_selector_v4_backup
+
+
+# Thresholds used by the rules of either module
+IV_RANK_THRESHOLDS = [35, 36, 40, 42, 45, 46, 48, 50, 52, 54, 55, 56, 60, 63, 65, 68, 70, 75]
+ADX_THRESHOLDS = [14, 15, 17, 18, 20, 21, 22, 23, 25, 26]
+RSI_THRESHOLDS = [33, 38, 40, 42, 44, 45, 46, 50, 52, 54, 55, 58, 59, 60, 62]
+ABS_PRICE_VS_SMA_THRESHOLDS = [0.005, 0.008, 0.012, 0.015, 0.022, 0.025, 0.03, 0.035, 0.04]
+
+# Per-row API checks per price_vs_sma_20 slice of the grid
+ROWS_PER_SLICE = 2000
+
+
+def boundary_values(thresholds, step, low, high):
+    """Each threshold, one step either side of it, the range ends and NaN."""
+    values = {round(t + d * step, 6) for t in thresholds for d in (-1, 0, 1)}
+    return np.array(sorted(values | {low, high}) + [np.nan], dtype=np.float64)
+
+
+def boundary_grid():
+    """
+    Yield the (iv_rank, adx_14, trend_regime, rsi_14) grid once per
+    price_vs_sma_20 value.
+    
+    Yields:
+        (price_vs_sma_20, [iv_rank, adx_14, trend_regime, rsi_14] arrays)
+    """
+    iv_rank = boundary_values(IV_RANK_THRESHOLDS, 0.5, 0, 100)
+    adx = boundary_values(ADX_THRESHOLDS, 0.5, 5, 50)
+    trend_regime = np.array([0, 1, 2, 2.5, 3, 4, np.nan])
+    rsi = boundary_values(RSI_THRESHOLDS, 0.5, 10, 90)
+    
+    signed = ABS_PRICE_VS_SMA_THRESHOLDS + [-t for t in ABS_PRICE_VS_SMA_THRESHOLDS]
+    price_vs_sma = boundary_values(signed, 0.001, -0.2, 0.2)
+    
+    columns = [c.ravel() for c in np.meshgrid(iv_rank, adx, trend_regime, rsi, indexing='ij')]
+    for pvs in price_vs_sma:
+        yield pvs, columns
+
+
+def check_module(module):
+    """
+    Compare the kernel, the masked cascade and the per-row API of one module.
+    
+    Args:
+        module: strategy_selector or strategy_selector_v4_backup
+    
+    Returns:
+        int: Number of rows checked
+    """
+    name = module.__name__.rsplit('.', 1)[-1]
+    print(f"\n{name} (Numba {'on' if module.NUMBA_AVAILABLE else 'off'})")
+    
+    rng = np.random.default_rng(0)
+    n_rows = 0
+    n_sampled = 0
+    
+    for pvs, (iv_rank, adx, trend_regime, rsi) in boundary_grid():
+        price_vs_sma = np.full(len(iv_rank), pvs)
+        masked = module._select_masked(iv_rank, adx, trend_regime, rsi, price_vs_sma)
+        
+        if module.NUMBA_AVAILABLE:
+            compiled = np.empty(len(iv_rank), dtype=np.int8)
+            module._select_many(iv_rank, adx, trend_regime, rsi, price_vs_sma, compiled)
+            bad = np.flatnonzero(compiled != masked)
+            assert len(bad) == 0, (
+                f"{name}: kernel and masked cascade disagree on {len(bad)} rows, e.g. "
+                f"features {[float(c[bad[0]]) for c in (iv_rank, adx, trend_regime, rsi)] + [float(pvs)]}: "
+                f"{module.STRATEGY_NAMES[compiled[bad[0]]]} vs {module.STRATEGY_NAMES[masked[bad[0]]]}"
+            )
+        
+        # Per-row API on a sample, in every accepted input form
+        for i in rng.choice(len(iv_rank), ROWS_PER_SLICE, replace=False):
+            row = (float(iv_rank[i]), float(adx[i]), float(trend_regime[i]), float(rsi[i]), float(pvs))
+            expected = masked[i]
+            features = dict(zip(module.FeatureRow._fields, row))
+            
+            for form in (features, module.FeatureRow(*row), row):
+                got = module.select_strategy_id(form)
+                assert got == expected, (
+                    f"{name}: select_strategy_id({form!r}) = {module.STRATEGY_NAMES[got]}, "
+                    f"cascade gives {module.STRATEGY_NAMES[expected]}"
+                )
+            assert module.select_strategy_from_features(features) == module.STRATEGY_NAMES[expected]
+            n_sampled += 1
+        
+        n_rows += len(iv_rank)
+    
+    print(f"  ✓ Kernel vs masked cascade: {n_rows:,} grid rows agree"
+          if module.NUMBA_AVAILABLE else "  - Kernel vs masked cascade: skipped (no Numba)")
+    print(f"  ✓ Per-row API: {n_sampled:,} sampled rows agree (dict, FeatureRow, tuple)")
+    
+    return n_rows
+
+
+def test_strategy_selector():
+    """Current (v6) rules."""
+    check_module(strategy_selector)
+
+
+def test_strategy_selector_v4_backup():
+    """Backup (v4) rules."""
+    check_module(strategy_selector_v4_backup)
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("STRATEGY SELECTOR REGRESSION TEST")
+    print("=" * 60)
+    
+    try:
+        test_strategy_selector()
+        test_strategy_selector_v4_backup()
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return 1
+    
+    print("\n" + "=" * 60)
+    print("All strategy selector checks passed ✅")
+    print("=" * 60)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
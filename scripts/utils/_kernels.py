@@ -0,0 +1,95 @@
+"""
+Numeric Kernels for Parameter Generation
+========================================
+
+Small, pure-numeric kernels used on the strike-selection hot path.
+
+The kernels are compiled with Numba when it is installed. Without Numba the
+same functions run as plain Python, so results are identical either way.
+Other modules reuse the njit/prange shim below for their own kernels.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def find_idx_by_delta(abs_deltas, target):
+    """
+    Find index of the option whose |delta| is closest to |target|.
+
+    Args:
+        abs_deltas: float64 array of absolute option deltas (precomputed per bucket)
+        target: Target delta (sign is ignored)
+
+    Returns:
+        Index into abs_deltas (-1 if no finite delta)
+    """
+    goal = abs(target)
+    best_idx = -1
+    best_diff = np.inf
+
+    for i in range(abs_deltas.shape[0]):
+        diff = abs(abs_deltas[i] - goal)
+        if diff < best_diff:
+            best_diff = diff
+            best_idx = i
+
+    return best_idx
+
+
+@njit(cache=True)
+def find_idx_by_price(strikes, target):
+    """
+    Find index of the strike closest to target price.
+
+    Args:
+        strikes: float64 array of strikes
+        target: Target strike price
+
+    Returns:
+        Index into strikes (-1 if no finite strike)
+    """
+    best_idx = -1
+    best_diff = np.inf
+
+    for i in range(strikes.shape[0]):
+        diff = abs(strikes[i] - target)
+        if diff < best_diff:
+            best_diff = diff
+            best_idx = i
+
+    return best_idx
+
+
+@njit(cache=True)
+def bull_call_metrics(long_ask, short_bid, long_k, short_k):
+    """
+    Per-contract metrics for a bull call spread.
+
+    Args:
+        long_ask: Ask price of the long (lower strike) call
+        short_bid: Bid price of the short (higher strike) call
+        long_k: Long call strike
+        short_k: Short call strike
+
+    Returns:
+        Tuple of (net_debit, max_profit, breakeven)
+    """
+    net_debit = (long_ask - short_bid) * 100.0
+    max_profit = (short_k - long_k) * 100.0 - net_debit
+    breakeven = long_k + net_debit / 100.0
+
+    return net_debit, max_profit, breakeven
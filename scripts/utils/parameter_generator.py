@@ -16,7 +16,137 @@ Version: 2.0 (Enhanced)
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import os
+import sys
+
+if not __package__:
+    # Run directly as a script: make the repo root importable for scripts.utils
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.utils._kernels import find_idx_by_delta, find_idx_by_price, bull_call_metrics
+
+# Optional columnar (Arrow) option chains
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# IV-rank breakpoints shared by the strike policies below. With
+# side='right' the buckets are: <30, 30-40, 40-50, 50-70, 70-75, >75
+# (70 and 75 stay in the lower bucket, matching the original "> 70" / "> 75").
+_IV_BUCKETS = np.array([30.0, 40.0, 50.0, np.nextafter(70.0, np.inf), np.nextafter(75.0, np.inf)])
+
+# Target deltas per IV bucket (one row per bucket)
+_DELTA_POLICY = {
+    # target_delta: ATM in very low IV, further OTM as IV rises
+    'LONG_CALL': np.array([0.50, 0.40, 0.30, 0.30, 0.30, 0.30]),
+    'LONG_PUT': np.array([-0.50, -0.40, -0.30, -0.30, -0.30, -0.30]),
+    # (long_delta, short_delta): tighter below 50 IV, wider above
+    'BULL_CALL_SPREAD': np.array([[0.50, 0.30]] * 3 + [[0.60, 0.25]] * 3),
+    'BEAR_PUT_SPREAD': np.array([[-0.50, -0.30]] * 3 + [[-0.60, -0.25]] * 3),
+    # (call_delta, put_delta): closer to ATM in very low IV
+    'LONG_STRANGLE': np.array([[0.35, -0.35]] + [[0.25, -0.25]] * 5),
+    # (put_short, put_long, call_short, call_long): wider wings above 70 IV
+    'IRON_CONDOR': np.array([[-0.25, -0.15, 0.25, 0.15]] * 4 + [[-0.20, -0.10, 0.20, 0.10]] * 2),
+}
+
+# Iron butterfly wing width (% of ATM strike) per IV bucket
+_WING_PCT_POLICY = np.array([0.05, 0.05, 0.05, 0.05, 0.05, 0.07])
+
+
+def _iv_policy_bucket(iv_rank: float) -> int:
+    """
+    Row of the IV policy tables for iv_rank (NaN is treated as neutral 50).
+    """
+    if np.isnan(iv_rank):
+        iv_rank = 50.0
+    return int(np.searchsorted(_IV_BUCKETS, iv_rank, side='right'))
+
+
+def _iv_bucket(iv_rank: float) -> int:
+    """
+    Bucket IV rank by the thresholds used for DTE selection.
+    
+    Buckets: 0 (<30), 1 (30-40), 2 (40-50, also NaN), 3 (50-70], 4 (>70)
+    """
+    if iv_rank < 30:
+        return 0
+    elif iv_rank < 40:
+        return 1
+    elif iv_rank > 70:
+        return 4
+    elif iv_rank > 50:
+        return 3
+    return 2
+
+
+@lru_cache(maxsize=256)
+def _classify_trend(rsi: float, adx: float, trend_regime: float) -> str:
+    """
+    Classify trend strength (cached; see ParameterGenerator._classify_trend_strength).
+    """
+    if adx > 30 and ((rsi > 65 and trend_regime >= 4) or (rsi < 35 and trend_regime <= 0)):
+        return 'VERY_STRONG'
+    elif adx > 25 and ((rsi > 60 and trend_regime >= 3) or (rsi < 40 and trend_regime <= 1)):
+        return 'STRONG'
+    elif adx > 20:
+        return 'MODERATE'
+    else:
+        return 'WEAK'
+
+
+def _nearest_dte(dtes: np.ndarray, target: int) -> int:
+    """
+    Nearest value to target in a sorted DTE array (the shorter DTE on ties).
+    """
+    i = int(np.searchsorted(dtes, target))
+    candidates = dtes[max(i - 1, 0):i + 1]
+    return int(candidates[np.abs(candidates - target).argmin()])
+
+
+@lru_cache(maxsize=256)
+def _dte_target(strategy: str, iv_bucket: int, trend_strength: str) -> int:
+    """
+    Target DTE before snapping to the chain (cached; see ParameterGenerator._select_optimal_dte).
+    """
+    # Strategy-specific DTE preferences
+    if strategy in ['IRON_CONDOR', 'IRON_BUTTERFLY']:
+        # High IV → shorter DTE (capture theta faster)
+        if iv_bucket == 4:
+            target = 7
+        elif iv_bucket == 3:
+            target = 14
+        else:
+            target = 21
+    
+    elif strategy in ['LONG_CALL', 'LONG_PUT']:
+        # Low IV → longer DTE (time to develop)
+        # Strong trend → longer DTE (ride it)
+        if iv_bucket == 0 and trend_strength == 'VERY_STRONG':
+            target = 45
+        elif iv_bucket <= 1:
+            target = 30
+        else:
+            target = 21
+    
+    elif strategy in ['BULL_CALL_SPREAD', 'BEAR_PUT_SPREAD']:
+        # Moderate DTE for spreads
+        if trend_strength == 'VERY_STRONG':
+            target = 30
+        else:
+            target = 21
+    
+    else:
+        # Default
+        target = 30
+    
+    return target
 
 
 class RiskManager:
@@ -49,11 +179,9 @@ class RiskManager:
         Returns:
             Number of contracts (1 to max_contracts)
         """
-        if max_loss_per_contract <= 0:
-            return 1
-        
-        # Calculate contracts based on risk
-        contracts = int(self.max_risk_amount / max_loss_per_contract)
+        # Calculate contracts based on risk (non-positive loss → 0, clamped to 1 below)
+        denom = max(max_loss_per_contract, 1e-9)
+        contracts = int(self.max_risk_amount / denom) * (max_loss_per_contract > 0)
         
         # Ensure between 1 and max
         return max(1, min(contracts, self.max_contracts))
@@ -81,36 +209,381 @@ class RiskManager:
         }
 
 
-class ParameterGenerator:
+# ============================================================================
+# INPUT / RESULT TYPES
+# ============================================================================
+
+@dataclass(slots=True)
+class FeatureVector:
     """
-    Enhanced parameter generator with sophisticated rules.
+    The market features read by the generators, extracted once per call.
     """
+    iv_rank: float
+    rsi_14: float
+    adx_14: float
+    trend_regime: float
     
-    def __init__(self, risk_manager: Optional[RiskManager] = None):
+    @classmethod
+    def from_dict(cls, features: Dict) -> 'FeatureVector':
+        """Build from a features dict, applying the neutral defaults."""
+        trend_regime = features.get('trend_regime', 2)
+        # A missing regime (None/NaN) fails every trend comparison, same as neutral 2
+        if trend_regime is None or trend_regime != trend_regime:
+            trend_regime = 2
+        
+        return cls(
+            float(features.get('iv_rank', 50.0)),
+            float(features.get('rsi_14', 50.0)),
+            float(features.get('adx_14', 20.0)),
+            float(trend_regime)
+        )
+
+
+class _Result:
+    """
+    Base for generator results (slotted dataclasses).
+    """
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict:
+        """Convert to the legacy dict format (fields in declaration order)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class LongOptionResult(_Result):
+    """LONG_CALL / LONG_PUT parameters."""
+    strategy: str
+    action: str
+    option_type: str
+    strike: float
+    dte: int
+    contracts: int
+    cost_per_contract: float
+    total_cost: float
+    max_loss: float
+    max_profit: str
+    breakeven: float
+    target_delta: float
+    iv_rank: float
+    trend_strength: str
+
+
+@dataclass(slots=True)
+class VerticalSpreadResult(_Result):
+    """BULL_CALL_SPREAD / BEAR_PUT_SPREAD parameters."""
+    strategy: str
+    long_strike: float
+    short_strike: float
+    dte: int
+    contracts: int
+    net_debit: float
+    total_debit: float
+    max_profit: float
+    total_max_profit: float
+    max_loss: float
+    total_max_loss: float
+    breakeven: float
+    spread_width: float
+    risk_reward_ratio: float
+    iv_rank: float
+
+
+@dataclass(slots=True)
+class LongStraddleResult(_Result):
+    """LONG_STRADDLE parameters."""
+    strategy: str
+    strike: float
+    dte: int
+    contracts: int
+    call_cost: float
+    put_cost: float
+    cost_per_contract: float
+    total_cost: float
+    max_loss: float
+    max_profit: str
+    breakeven_up: float
+    breakeven_down: float
+    breakeven_range: float
+    iv_rank: float
+
+
+@dataclass(slots=True)
+class LongStrangleResult(_Result):
+    """LONG_STRANGLE parameters."""
+    strategy: str
+    call_strike: float
+    put_strike: float
+    dte: int
+    contracts: int
+    call_cost: float
+    put_cost: float
+    cost_per_contract: float
+    total_cost: float
+    max_loss: float
+    max_profit: str
+    breakeven_up: float
+    breakeven_down: float
+    breakeven_range: float
+    strike_width: float
+    iv_rank: float
+
+
+@dataclass(slots=True)
+class IronCondorResult(_Result):
+    """IRON_CONDOR parameters."""
+    strategy: str
+    put_short_strike: float
+    put_long_strike: float
+    call_short_strike: float
+    call_long_strike: float
+    dte: int
+    contracts: int
+    net_credit: float
+    total_credit: float
+    max_profit: float
+    total_max_profit: float
+    max_loss: float
+    total_max_loss: float
+    breakeven_down: float
+    breakeven_up: float
+    profit_zone_width: float
+    risk_reward_ratio: float
+    iv_rank: float
+
+
+@dataclass(slots=True)
+class IronButterflyResult(_Result):
+    """IRON_BUTTERFLY parameters."""
+    strategy: str
+    center_strike: float
+    long_put_strike: float
+    long_call_strike: float
+    dte: int
+    contracts: int
+    net_credit: float
+    total_credit: float
+    max_profit: float
+    total_max_profit: float
+    max_loss: float
+    total_max_loss: float
+    breakeven_down: float
+    breakeven_up: float
+    profit_zone_width: float
+    wing_width: float
+    risk_reward_ratio: float
+    iv_rank: float
+
+
+@dataclass(slots=True)
+class CalendarSpreadResult(_Result):
+    """CALENDAR_SPREAD parameters."""
+    strategy: str
+    strike: float
+    option_type: str
+    near_dte: int
+    far_dte: int
+    contracts: int
+    net_debit: float
+    total_debit: float
+    max_loss: float
+    total_max_loss: float
+    max_profit: str
+    note: str
+    iv_rank: float
+
+
+@dataclass(slots=True)
+class DiagonalSpreadResult(_Result):
+    """DIAGONAL_SPREAD parameters."""
+    strategy: str
+    option_type: str
+    long_strike: float
+    short_strike: float
+    near_dte: int
+    far_dte: int
+    contracts: int
+    net_debit: float
+    total_debit: float
+    max_loss: float
+    total_max_loss: float
+    max_profit: str
+    bias: str
+    note: str
+    iv_rank: float
+
+
+# Columns read by OptionChainView
+CHAIN_COLUMNS = ['type', 'dte', 'strike', 'delta', 'bid', 'ask']
+
+
+def to_record_batch(option_chain: pd.DataFrame) -> 'pa.RecordBatch':
+    """
+    Convert an option chain to a columnar Arrow RecordBatch.
+    
+    Do this once where the chain is produced; OptionChainView then reads the
+    contiguous float64 columns without copying them.
+    
+    Args:
+        option_chain: Option chain DataFrame
+    
+    Returns:
+        RecordBatch with the CHAIN_COLUMNS
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for columnar option chains (pip install pyarrow)")
+    
+    return pa.RecordBatch.from_pandas(option_chain[CHAIN_COLUMNS], preserve_index=False)
+
+
+def _chain_column(option_chain, name: str) -> np.ndarray:
+    """
+    One column of a DataFrame or RecordBatch chain as a NumPy array.
+    
+    Arrow columns without nulls are returned as zero-copy views.
+    """
+    if PYARROW_AVAILABLE and isinstance(option_chain, pa.RecordBatch):
+        return option_chain.column(name).to_numpy(zero_copy_only=False)
+    return option_chain[name].to_numpy()
+
+
+def _grouped(codes: np.ndarray, columns: List[np.ndarray]):
+    """
+    Split columns into groups by integer code, keeping chain order in each group.
+    
+    Each column is gathered once into group order, so every group is a
+    contiguous slice. Rows with code -1 (missing key) are skipped.
+    
+    Yields:
+        (code, [column slice, ...]) per group
+    """
+    if len(codes) == 0:
+        return
+    
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    columns = [column[order] for column in columns]
+    bounds = np.flatnonzero(np.diff(codes)) + 1
+    
+    for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(codes)]):
+        if codes[start] >= 0:
+            yield codes[start], [column[start:end] for column in columns]
+
+
+class OptionChainView:
+    """
+    Read-only NumPy index over an option chain.
+    
+    Options are bucketed by (type, dte). Bucket arrays keep chain order, so
+    nearest-delta/price ties resolve exactly as a DataFrame scan would.
+    Exact-strike prices come from a per-bucket strike -> (bid, ask) hash map,
+    built the first time the bucket is priced.
+    
+    The view is a snapshot of the chain when it was built: build a new one
+    after quotes change.
+    """
+    
+    def __init__(self, option_chain):
         """
-        Initialize parameter generator.
+        Build the index.
         
         Args:
-            risk_manager: RiskManager instance (creates default if None)
+            option_chain: Available options (type, dte, strike, bid, ask, delta)
+                as a DataFrame or an Arrow RecordBatch (see to_record_batch)
         """
-        self.risk_manager = risk_manager or RiskManager()
+        self.chain = option_chain
+        self.buckets = {}
+        self.by_type = {}
+        # Memoized nearest-delta strikes: (type, dte, |delta|) -> strike.
+        # Lives as long as the view: one generate() call or generate_batch() job
+        self.delta_strikes = {}
+        
+        strikes = np.asarray(_chain_column(option_chain, 'strike'), dtype=np.float64)
+        abs_deltas = np.abs(np.asarray(_chain_column(option_chain, 'delta'), dtype=np.float64))
+        bids = np.asarray(_chain_column(option_chain, 'bid'), dtype=np.float64)
+        asks = np.asarray(_chain_column(option_chain, 'ask'), dtype=np.float64)
+        
+        type_codes, type_names = pd.factorize(_chain_column(option_chain, 'type'))
+        dte_codes, dte_values = pd.factorize(_chain_column(option_chain, 'dte'))
+        self.unique_dtes = np.unique(np.asarray(dte_values).astype(np.int32))
+        
+        # All DTEs per type (fallback when a DTE has no options of that type)
+        for code, (strike, abs_delta) in _grouped(type_codes, [strikes, abs_deltas]):
+            self.by_type[type_names[code]] = {'strike': strike, 'abs_delta': abs_delta}
+        
+        n_dtes = len(dte_values)
+        bucket_codes = np.where((type_codes >= 0) & (dte_codes >= 0),
+                                type_codes * n_dtes + dte_codes, -1)
+        
+        for code, (strike, abs_delta, bid, ask) in _grouped(bucket_codes,
+                                                            [strikes, abs_deltas, bids, asks]):
+            option_type = type_names[code // n_dtes]
+            dte = dte_values[code % n_dtes]
+            self.buckets[(option_type, dte)] = {'strike': strike, 'abs_delta': abs_delta,
+                                                'bid': bid, 'ask': ask}
     
-    def generate(self, strategy: str, option_chain: pd.DataFrame,
-                 features: Dict, current_price: float) -> Dict:
+    def quote(self, option_type: str, dte: int, strike: float) -> Tuple[float, float]:
         """
-        Generate parameters for given strategy.
+        Get (bid, ask) for an exact strike.
         
         Args:
-            strategy: Strategy name
-            option_chain: Available options
-            features: Market features (84 features)
-            current_price: Current underlying price
+            option_type: 'call' or 'put'
+            dte: Days to expiration
+            strike: Strike price
         
         Returns:
-            Dict with strategy parameters
+            (bid, ask)
         """
-        # Route to strategy-specific generator
-        generators = {
+        bucket = self.buckets.get((option_type, dte))
+        prices = None if bucket is None else bucket.get('prices')
+        
+        if prices is None and bucket is not None:
+            # First row wins for duplicate strikes (same as the original filter-and-take-first)
+            strikes, first = np.unique(bucket['strike'], return_index=True)
+            prices = dict(zip(strikes.tolist(),
+                              zip(bucket['bid'][first].tolist(), bucket['ask'][first].tolist())))
+            bucket['prices'] = prices
+        
+        quote = None if prices is None else prices.get(strike)
+        
+        if quote is None:
+            raise ValueError(f"Option not found: {option_type} ${strike} {dte}DTE")
+        
+        return quote
+    
+    def find_price(self, strike: float, option_type: str, dte: int, side: str) -> float:
+        """
+        Get bid or ask for an exact strike.
+        
+        Args:
+            strike: Strike price
+            option_type: 'call' or 'put'
+            dte: Days to expiration
+            side: 'bid' or 'ask'
+        
+        Returns:
+            Price
+        """
+        bid, ask = self.quote(option_type, dte, strike)
+        return ask if side == 'ask' else bid
+
+
+class ParameterGenerator:
+    """
+    Enhanced parameter generator with sophisticated rules.
+    """
+    
+    def __init__(self, risk_manager: Optional[RiskManager] = None):
+        """
+        Initialize parameter generator.
+        
+        Args:
+            risk_manager: RiskManager instance (creates default if None)
+        """
+        self.risk_manager = risk_manager or RiskManager()
+        
+        # Strategy-specific generators
+        self._generators = {
             'LONG_CALL': self._generate_long_call,
             'LONG_PUT': self._generate_long_put,
             'BULL_CALL_SPREAD': self._generate_bull_call_spread,
@@ -122,11 +595,101 @@ class ParameterGenerator:
             'CALENDAR_SPREAD': self._generate_calendar_spread,
             'DIAGONAL_SPREAD': self._generate_diagonal_spread
         }
+    
+    def _get_view(self, option_chain) -> OptionChainView:
+        """
+        Get an OptionChainView for option_chain.
+        
+        generate() and generate_batch() pass their view down in place of the
+        chain, so it is returned as is; a raw chain gets a fresh view.
+        """
+        if isinstance(option_chain, OptionChainView):
+            return option_chain
+        return OptionChainView(option_chain)
+    
+    def generate(self, strategy: str, option_chain: pd.DataFrame,
+                 features: Dict, current_price: float, as_dict: bool = True):
+        """
+        Generate parameters for given strategy.
+        
+        Args:
+            strategy: Strategy name
+            option_chain: Available options (DataFrame or Arrow RecordBatch), or
+                a prebuilt OptionChainView to reuse across calls on an unchanged chain
+            features: Market features (84 features) or a prebuilt FeatureVector
+            current_price: Current underlying price
+            as_dict: Return a dict (default) or the slotted result object,
+                which is cheaper for sweeps that only read a few fields
+        
+        Returns:
+            Dict (or result dataclass) with strategy parameters
+        """
+        # Route to strategy-specific generator
+        generators = self._generators
         
         if strategy not in generators:
             raise ValueError(f"Unknown strategy: {strategy}")
         
-        return generators[strategy](option_chain, features, current_price)
+        if not isinstance(features, FeatureVector):
+            features = FeatureVector.from_dict(features)
+        
+        # Index the chain once for this call; quotes are read fresh every call
+        view = self._get_view(option_chain)
+        result = generators[strategy](view, features, current_price)
+        
+        return result.to_dict() if as_dict else result
+    
+    def generate_batch(self, jobs: List[Tuple], strategies: Optional[List[str]] = None,
+                       as_dict: bool = True) -> List[Dict]:
+        """
+        Generate parameters for many underlyings (e.g. a watchlist scan) in one pass.
+        
+        Every view is built once up front and shared by all strategies for that
+        underlying, so the legs of each strategy resolve with one vectorized
+        search per option type.
+        
+        Args:
+            jobs: (option_chain, features, current_price) per underlying;
+                option_chain may be a DataFrame, an Arrow RecordBatch or a
+                prebuilt OptionChainView
+            strategies: Strategies to generate (default: all)
+            as_dict: Return dicts (default) or result dataclasses
+        
+        Returns:
+            One {strategy: parameters} dict per job, aligned with jobs. A strategy
+            the chain cannot support (e.g. no options at the chosen DTE) maps to None.
+        """
+        generators = self._generators
+        strategies = list(generators) if strategies is None else list(strategies)
+        
+        for strategy in strategies:
+            if strategy not in generators:
+                raise ValueError(f"Unknown strategy: {strategy}")
+        
+        # Build all views up front
+        views = [
+            chain if isinstance(chain, OptionChainView) else OptionChainView(chain)
+            for chain, _, _ in jobs
+        ]
+        
+        results = []
+        for view, (_, features, current_price) in zip(views, jobs):
+            if not isinstance(features, FeatureVector):
+                features = FeatureVector.from_dict(features)
+            
+            parameters = {}
+            
+            for strategy in strategies:
+                try:
+                    result = generators[strategy](view, features, current_price)
+                except ValueError:
+                    parameters[strategy] = None
+                    continue
+                parameters[strategy] = result.to_dict() if as_dict else result
+            
+            results.append(parameters)
+        
+        return results
     
     def _select_optimal_dte(self, option_chain: pd.DataFrame, strategy: str,
                            iv_rank: float, trend_strength: str) -> int:
@@ -142,43 +705,13 @@ class ParameterGenerator:
         Returns:
             Optimal DTE
         """
-        available_dtes = sorted(option_chain['dte'].unique())
-        
-        # Strategy-specific DTE preferences
-        if strategy in ['IRON_CONDOR', 'IRON_BUTTERFLY']:
-            # High IV → shorter DTE (capture theta faster)
-            if iv_rank > 70:
-                target = 7
-            elif iv_rank > 50:
-                target = 14
-            else:
-                target = 21
-        
-        elif strategy in ['LONG_CALL', 'LONG_PUT']:
-            # Low IV → longer DTE (time to develop)
-            # Strong trend → longer DTE (ride it)
-            if iv_rank < 30 and trend_strength == 'VERY_STRONG':
-                target = 45
-            elif iv_rank < 40:
-                target = 30
-            else:
-                target = 21
-        
-        elif strategy in ['BULL_CALL_SPREAD', 'BEAR_PUT_SPREAD']:
-            # Moderate DTE for spreads
-            if trend_strength == 'VERY_STRONG':
-                target = 30
-            else:
-                target = 21
-        
-        else:
-            # Default
-            target = 30
+        available_dtes = self._get_view(option_chain).unique_dtes
+        target = _dte_target(strategy, _iv_bucket(iv_rank), trend_strength)
         
-        # Find closest available DTE
-        return min(available_dtes, key=lambda x: abs(x - target))
+        # Find closest available DTE (first/shortest on ties)
+        return _nearest_dte(available_dtes, target)
     
-    def _classify_trend_strength(self, features: Dict) -> str:
+    def _classify_trend_strength(self, features: FeatureVector) -> str:
         """
         Classify trend strength from features.
         
@@ -188,18 +721,68 @@ class ParameterGenerator:
         Returns:
             Trend strength: VERY_STRONG, STRONG, MODERATE, WEAK
         """
-        rsi = features.get('rsi_14', 50)
-        adx = features.get('adx_14', 20)
-        trend_regime = features.get('trend_regime', 2)
+        return _classify_trend(features.rsi_14, features.adx_14, features.trend_regime)
+    
+    def _resolve_legs(self, view: OptionChainView, dte: int,
+                      specs: List[Tuple[str, str, float]]) -> List[Tuple[float, float, float]]:
+        """
+        Resolve several legs at one DTE with one vectorized search per option type.
         
-        if adx > 30 and ((rsi > 65 and trend_regime >= 4) or (rsi < 35 and trend_regime <= 0)):
-            return 'VERY_STRONG'
-        elif adx > 25 and ((rsi > 60 and trend_regime >= 3) or (rsi < 40 and trend_regime <= 1)):
-            return 'STRONG'
-        elif adx > 20:
-            return 'MODERATE'
-        else:
-            return 'WEAK'
+        Args:
+            view: OptionChainView of the chain
+            dte: Days to expiration
+            specs: (option_type, 'delta' | 'price', target) for each leg
+        
+        Returns:
+            (strike, bid, ask) for each leg, in spec order
+        """
+        legs = [None] * len(specs)
+        delta_strikes = view.delta_strikes
+        
+        for option_type in {spec[0] for spec in specs}:
+            rows = [i for i, spec in enumerate(specs) if spec[0] == option_type]
+            bucket = view.buckets.get((option_type, dte))
+            
+            if bucket is None:
+                raise ValueError(f"No {option_type} options available at {dte}DTE")
+            
+            # Reuse strikes already found for the same (type, dte, |delta|)
+            strikes = {}
+            search = []
+            for i in rows:
+                key = (option_type, dte, abs(specs[i][2]))
+                if specs[i][1] == 'delta' and key in delta_strikes:
+                    strikes[i] = delta_strikes[key]
+                else:
+                    search.append(i)
+            
+            if search:
+                by_delta = np.array([specs[i][1] == 'delta' for i in search])[:, None]
+                targets = np.array([specs[i][2] for i in search], dtype=np.float64)[:, None]
+                
+                # Distance from every leg target to every option in the bucket
+                dist = np.where(
+                    by_delta,
+                    np.abs(bucket['abs_delta'] - np.abs(targets)),
+                    np.abs(bucket['strike'] - targets)
+                )
+                dist[np.isnan(dist)] = np.inf
+                best = dist.argmin(axis=1)
+                
+                if np.isinf(dist[np.arange(len(search)), best]).any():
+                    raise ValueError(f"No {option_type} options with valid delta/strike at {dte}DTE")
+                
+                for i, strike in zip(search, bucket['strike'][best].tolist()):
+                    strikes[i] = strike
+                    if specs[i][1] == 'delta':
+                        delta_strikes[(option_type, dte, abs(specs[i][2]))] = strike
+            
+            # Price each strike from its first row in the bucket (exact-strike semantics)
+            for i in rows:
+                bid, ask = view.quote(option_type, dte, strikes[i])
+                legs[i] = (strikes[i], bid, ask)
+        
+        return legs
     
     def _find_strike_by_delta(self, option_chain: pd.DataFrame, target_delta: float,
                               option_type: str, dte: int) -> float:
@@ -215,24 +798,32 @@ class ParameterGenerator:
         Returns:
             Strike price
         """
-        # Filter by type and DTE
-        filtered = option_chain[
-            (option_chain['type'] == option_type) &
-            (option_chain['dte'] == dte)
-        ].copy()
+        view = self._get_view(option_chain)
+        
+        # Shared with _resolve_legs (e.g. the ATM call used by several strategies)
+        key = (option_type, dte, abs(target_delta))
+        if key in view.delta_strikes:
+            return view.delta_strikes[key]
+        
+        # Options of this type at this DTE
+        options = view.buckets.get((option_type, dte))
         
-        if len(filtered) == 0:
+        if options is None:
             # Fallback to any DTE
-            filtered = option_chain[option_chain['type'] == option_type].copy()
+            options = view.by_type.get(option_type)
         
-        if len(filtered) == 0:
+        if options is None:
             raise ValueError(f"No {option_type} options available")
         
         # Find closest delta
-        filtered['delta_diff'] = (filtered['delta'].abs() - abs(target_delta)).abs()
-        best = filtered.nsmallest(1, 'delta_diff')
+        idx = find_idx_by_delta(options['abs_delta'], target_delta)
+        if idx < 0:
+            raise ValueError(f"No {option_type} options with valid delta")
         
-        return float(best['strike'].iloc[0])
+        strike = float(options['strike'][idx])
+        view.delta_strikes[key] = strike
+        
+        return strike
     
     def _find_strike_by_price(self, option_chain: pd.DataFrame, target_price: float,
                              option_type: str, dte: int) -> float:
@@ -248,23 +839,25 @@ class ParameterGenerator:
         Returns:
             Strike price
         """
-        # Filter by type and DTE
-        filtered = option_chain[
-            (option_chain['type'] == option_type) &
-            (option_chain['dte'] == dte)
-        ].copy()
+        view = self._get_view(option_chain)
+        
+        # Options of this type at this DTE
+        options = view.buckets.get((option_type, dte))
         
-        if len(filtered) == 0:
-            filtered = option_chain[option_chain['type'] == option_type].copy()
+        if options is None:
+            # Fallback to any DTE
+            options = view.by_type.get(option_type)
         
-        if len(filtered) == 0:
+        if options is None:
             raise ValueError(f"No {option_type} options available")
         
         # Find closest strike
-        filtered['price_diff'] = (filtered['strike'] - target_price).abs()
-        best = filtered.nsmallest(1, 'price_diff')
+        strikes = options['strike']
+        idx = find_idx_by_price(strikes, target_price)
+        if idx < 0:
+            raise ValueError(f"No {option_type} options with valid strike")
         
-        return float(best['strike'].iloc[0])
+        return float(strikes[idx])
 
     
     def _get_option_cost(self, option_chain: pd.DataFrame, strike: float,
@@ -281,16 +874,7 @@ class ParameterGenerator:
         Returns:
             Ask price
         """
-        option = option_chain[
-            (option_chain['strike'] == strike) &
-            (option_chain['type'] == option_type) &
-            (option_chain['dte'] == dte)
-        ]
-        
-        if len(option) == 0:
-            raise ValueError(f"Option not found: {option_type} ${strike} {dte}DTE")
-        
-        return float(option['ask'].iloc[0])
+        return self._get_view(option_chain).find_price(strike, option_type, dte, 'ask')
     
     def _get_option_bid(self, option_chain: pd.DataFrame, strike: float,
                        option_type: str, dte: int) -> float:
@@ -306,45 +890,28 @@ class ParameterGenerator:
         Returns:
             Bid price
         """
-        option = option_chain[
-            (option_chain['strike'] == strike) &
-            (option_chain['type'] == option_type) &
-            (option_chain['dte'] == dte)
-        ]
-        
-        if len(option) == 0:
-            raise ValueError(f"Option not found: {option_type} ${strike} {dte}DTE")
-        
-        return float(option['bid'].iloc[0])
+        return self._get_view(option_chain).find_price(strike, option_type, dte, 'bid')
     
     # ========================================================================
     # STRATEGY-SPECIFIC GENERATORS
     # ========================================================================
     
-    def _generate_long_call(self, option_chain: pd.DataFrame, features: Dict,
-                           current_price: float) -> Dict:
+    def _generate_long_call(self, option_chain: pd.DataFrame, features: FeatureVector,
+                           current_price: float) -> LongOptionResult:
         """
         Generate parameters for LONG CALL.
         
         Strategy: Buy ATM or slightly OTM call
         Best when: Low IV + Strong uptrend
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         trend_strength = self._classify_trend_strength(features)
         
         # Select DTE
         dte = self._select_optimal_dte(option_chain, 'LONG_CALL', iv_rank, trend_strength)
         
-        # IV-adaptive strike selection
-        if iv_rank < 30:
-            # Very low IV → buy ATM (maximize leverage)
-            target_delta = 0.50
-        elif iv_rank < 40:
-            # Low IV → slightly OTM
-            target_delta = 0.40
-        else:
-            # Medium IV → more OTM
-            target_delta = 0.30
+        # IV-adaptive strike selection (ATM in very low IV → more OTM as IV rises)
+        target_delta = float(_DELTA_POLICY['LONG_CALL'][_iv_policy_bucket(iv_rank)])
         
         # Find strike by delta
         strike = self._find_strike_by_delta(option_chain, target_delta, 'call', dte)
@@ -357,47 +924,39 @@ class ParameterGenerator:
         # Calculate metrics
         total_cost = cost * 100 * contracts
         
-        return {
-            'strategy': 'LONG_CALL',
-            'action': 'BUY',
-            'option_type': 'CALL',
-            'strike': strike,
-            'dte': dte,
-            'contracts': contracts,
-            'cost_per_contract': cost * 100,
-            'total_cost': total_cost,
-            'max_loss': total_cost,
-            'max_profit': 'Unlimited',
-            'breakeven': strike + cost,
-            'target_delta': target_delta,
-            'iv_rank': iv_rank,
-            'trend_strength': trend_strength
-        }
+        return LongOptionResult(
+            strategy='LONG_CALL',
+            action='BUY',
+            option_type='CALL',
+            strike=strike,
+            dte=dte,
+            contracts=contracts,
+            cost_per_contract=cost * 100,
+            total_cost=total_cost,
+            max_loss=total_cost,
+            max_profit='Unlimited',
+            breakeven=strike + cost,
+            target_delta=target_delta,
+            iv_rank=iv_rank,
+            trend_strength=trend_strength
+        )
     
-    def _generate_long_put(self, option_chain: pd.DataFrame, features: Dict,
-                          current_price: float) -> Dict:
+    def _generate_long_put(self, option_chain: pd.DataFrame, features: FeatureVector,
+                          current_price: float) -> LongOptionResult:
         """
         Generate parameters for LONG PUT.
         
         Strategy: Buy ATM or slightly OTM put
         Best when: Low IV + Strong downtrend
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         trend_strength = self._classify_trend_strength(features)
         
         # Select DTE
         dte = self._select_optimal_dte(option_chain, 'LONG_PUT', iv_rank, trend_strength)
         
-        # IV-adaptive strike selection
-        if iv_rank < 30:
-            # Very low IV → buy ATM
-            target_delta = -0.50
-        elif iv_rank < 40:
-            # Low IV → slightly OTM
-            target_delta = -0.40
-        else:
-            # Medium IV → more OTM
-            target_delta = -0.30
+        # IV-adaptive strike selection (ATM in very low IV → more OTM as IV rises)
+        target_delta = float(_DELTA_POLICY['LONG_PUT'][_iv_policy_bucket(iv_rank)])
         
         # Find strike by delta
         strike = self._find_strike_by_delta(option_chain, target_delta, 'put', dte)
@@ -410,59 +969,51 @@ class ParameterGenerator:
         # Calculate metrics
         total_cost = cost * 100 * contracts
         
-        return {
-            'strategy': 'LONG_PUT',
-            'action': 'BUY',
-            'option_type': 'PUT',
-            'strike': strike,
-            'dte': dte,
-            'contracts': contracts,
-            'cost_per_contract': cost * 100,
-            'total_cost': total_cost,
-            'max_loss': total_cost,
-            'max_profit': 'Unlimited',
-            'breakeven': strike - cost,
-            'target_delta': target_delta,
-            'iv_rank': iv_rank,
-            'trend_strength': trend_strength
-        }
+        return LongOptionResult(
+            strategy='LONG_PUT',
+            action='BUY',
+            option_type='PUT',
+            strike=strike,
+            dte=dte,
+            contracts=contracts,
+            cost_per_contract=cost * 100,
+            total_cost=total_cost,
+            max_loss=total_cost,
+            max_profit='Unlimited',
+            breakeven=strike - cost,
+            target_delta=target_delta,
+            iv_rank=iv_rank,
+            trend_strength=trend_strength
+        )
     
-    def _generate_bull_call_spread(self, option_chain: pd.DataFrame, features: Dict,
-                                   current_price: float) -> Dict:
+    def _generate_bull_call_spread(self, option_chain: pd.DataFrame, features: FeatureVector,
+                                   current_price: float) -> VerticalSpreadResult:
         """
         Generate parameters for BULL CALL SPREAD.
         
         Strategy: Buy ATM call, sell OTM call
         Best when: Medium IV + Moderate bullish trend
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         trend_strength = self._classify_trend_strength(features)
         
         # Select DTE
         dte = self._select_optimal_dte(option_chain, 'BULL_CALL_SPREAD', iv_rank, trend_strength)
         
-        # IV-adaptive strike selection
-        if iv_rank < 50:
-            # Lower IV → tighter spread (more leverage)
-            long_delta = 0.50  # ATM
-            short_delta = 0.30  # Moderate OTM
-        else:
-            # Higher IV → wider spread (more premium)
-            long_delta = 0.60  # ITM
-            short_delta = 0.25  # Further OTM
-        
-        # Find strikes
-        long_strike = self._find_strike_by_delta(option_chain, long_delta, 'call', dte)
-        short_strike = self._find_strike_by_delta(option_chain, short_delta, 'call', dte)
+        # IV-adaptive strike selection (lower IV → tighter spread, higher IV → wider)
+        long_delta, short_delta = _DELTA_POLICY['BULL_CALL_SPREAD'][_iv_policy_bucket(iv_rank)]
         
-        # Get costs
-        long_cost = self._get_option_cost(option_chain, long_strike, 'call', dte)
-        short_credit = self._get_option_bid(option_chain, short_strike, 'call', dte)
+        # Find strikes and costs
+        (long_strike, _, long_cost), (short_strike, short_credit, _) = self._resolve_legs(
+            self._get_view(option_chain), dte,
+            [('call', 'delta', long_delta), ('call', 'delta', short_delta)]
+        )
         
         # Calculate spread metrics
-        net_debit = (long_cost - short_credit) * 100
+        net_debit, max_profit, breakeven = bull_call_metrics(
+            long_cost, short_credit, long_strike, short_strike
+        )
         spread_width = (short_strike - long_strike) * 100
-        max_profit = spread_width - net_debit
         
         # Position sizing
         contracts = self.risk_manager.calculate_position_size(net_debit)
@@ -471,55 +1022,46 @@ class ParameterGenerator:
         total_debit = net_debit * contracts
         total_max_profit = max_profit * contracts
         
-        return {
-            'strategy': 'BULL_CALL_SPREAD',
-            'long_strike': long_strike,
-            'short_strike': short_strike,
-            'dte': dte,
-            'contracts': contracts,
-            'net_debit': net_debit,
-            'total_debit': total_debit,
-            'max_profit': max_profit,
-            'total_max_profit': total_max_profit,
-            'max_loss': net_debit,
-            'total_max_loss': total_debit,
-            'breakeven': long_strike + (net_debit / 100),
-            'spread_width': spread_width / 100,
-            'risk_reward_ratio': max_profit / net_debit if net_debit > 0 else 0,
-            'iv_rank': iv_rank
-        }
+        return VerticalSpreadResult(
+            strategy='BULL_CALL_SPREAD',
+            long_strike=long_strike,
+            short_strike=short_strike,
+            dte=dte,
+            contracts=contracts,
+            net_debit=net_debit,
+            total_debit=total_debit,
+            max_profit=max_profit,
+            total_max_profit=total_max_profit,
+            max_loss=net_debit,
+            total_max_loss=total_debit,
+            breakeven=breakeven,
+            spread_width=spread_width / 100,
+            risk_reward_ratio=max_profit / net_debit if net_debit > 0 else 0,
+            iv_rank=iv_rank
+        )
     
-    def _generate_bear_put_spread(self, option_chain: pd.DataFrame, features: Dict,
-                                  current_price: float) -> Dict:
+    def _generate_bear_put_spread(self, option_chain: pd.DataFrame, features: FeatureVector,
+                                  current_price: float) -> VerticalSpreadResult:
         """
         Generate parameters for BEAR PUT SPREAD.
         
         Strategy: Buy ATM put, sell OTM put
         Best when: Medium IV + Moderate bearish trend
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         trend_strength = self._classify_trend_strength(features)
         
         # Select DTE
         dte = self._select_optimal_dte(option_chain, 'BEAR_PUT_SPREAD', iv_rank, trend_strength)
         
-        # IV-adaptive strike selection
-        if iv_rank < 50:
-            # Lower IV → tighter spread
-            long_delta = -0.50  # ATM
-            short_delta = -0.30  # Moderate OTM
-        else:
-            # Higher IV → wider spread
-            long_delta = -0.60  # ITM
-            short_delta = -0.25  # Further OTM
-        
-        # Find strikes
-        long_strike = self._find_strike_by_delta(option_chain, long_delta, 'put', dte)
-        short_strike = self._find_strike_by_delta(option_chain, short_delta, 'put', dte)
+        # IV-adaptive strike selection (lower IV → tighter spread, higher IV → wider)
+        long_delta, short_delta = _DELTA_POLICY['BEAR_PUT_SPREAD'][_iv_policy_bucket(iv_rank)]
         
-        # Get costs
-        long_cost = self._get_option_cost(option_chain, long_strike, 'put', dte)
-        short_credit = self._get_option_bid(option_chain, short_strike, 'put', dte)
+        # Find strikes and costs
+        (long_strike, _, long_cost), (short_strike, short_credit, _) = self._resolve_legs(
+            self._get_view(option_chain), dte,
+            [('put', 'delta', long_delta), ('put', 'delta', short_delta)]
+        )
         
         # Calculate spread metrics
         net_debit = (long_cost - short_credit) * 100
@@ -533,48 +1075,52 @@ class ParameterGenerator:
         total_debit = net_debit * contracts
         total_max_profit = max_profit * contracts
         
-        return {
-            'strategy': 'BEAR_PUT_SPREAD',
-            'long_strike': long_strike,
-            'short_strike': short_strike,
-            'dte': dte,
-            'contracts': contracts,
-            'net_debit': net_debit,
-            'total_debit': total_debit,
-            'max_profit': max_profit,
-            'total_max_profit': total_max_profit,
-            'max_loss': net_debit,
-            'total_max_loss': total_debit,
-            'breakeven': long_strike - (net_debit / 100),
-            'spread_width': spread_width / 100,
-            'risk_reward_ratio': max_profit / net_debit if net_debit > 0 else 0,
-            'iv_rank': iv_rank
-        }
+        return VerticalSpreadResult(
+            strategy='BEAR_PUT_SPREAD',
+            long_strike=long_strike,
+            short_strike=short_strike,
+            dte=dte,
+            contracts=contracts,
+            net_debit=net_debit,
+            total_debit=total_debit,
+            max_profit=max_profit,
+            total_max_profit=total_max_profit,
+            max_loss=net_debit,
+            total_max_loss=total_debit,
+            breakeven=long_strike - (net_debit / 100),
+            spread_width=spread_width / 100,
+            risk_reward_ratio=max_profit / net_debit if net_debit > 0 else 0,
+            iv_rank=iv_rank
+        )
     
-    def _generate_long_straddle(self, option_chain: pd.DataFrame, features: Dict,
-                                current_price: float) -> Dict:
+    def _generate_long_straddle(self, option_chain: pd.DataFrame, features: FeatureVector,
+                                current_price: float) -> LongStraddleResult:
         """
         Generate parameters for LONG STRADDLE.
         
         Strategy: Buy ATM call + ATM put
         Best when: Low IV + Expecting big move
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         
         # Select DTE (prefer longer for straddles)
         dte = self._select_optimal_dte(option_chain, 'LONG_STRADDLE', iv_rank, 'MODERATE')
         
+        view = self._get_view(option_chain)
+        
         # Find ATM strike (50 delta for both)
-        call_strike = self._find_strike_by_delta(option_chain, 0.50, 'call', dte)
-        put_strike = self._find_strike_by_delta(option_chain, -0.50, 'put', dte)
+        (call_strike, _, _), (put_strike, _, _) = self._resolve_legs(
+            view, dte, [('call', 'delta', 0.50), ('put', 'delta', -0.50)]
+        )
         
         # Use same strike (ATM)
         atm_strike = (call_strike + put_strike) / 2
-        atm_strike = self._find_strike_by_price(option_chain, atm_strike, 'call', dte)
+        [(atm_strike, _, call_cost)] = self._resolve_legs(
+            view, dte, [('call', 'price', atm_strike)]
+        )
         
         # Get costs
-        call_cost = self._get_option_cost(option_chain, atm_strike, 'call', dte)
-        put_cost = self._get_option_cost(option_chain, atm_strike, 'put', dte)
+        put_cost = view.find_price(atm_strike, 'put', dte, 'ask')
         
         # Calculate metrics
         total_cost_per_contract = (call_cost + put_cost) * 100
@@ -587,53 +1133,44 @@ class ParameterGenerator:
         breakeven_up = atm_strike + (call_cost + put_cost)
         breakeven_down = atm_strike - (call_cost + put_cost)
         
-        return {
-            'strategy': 'LONG_STRADDLE',
-            'strike': atm_strike,
-            'dte': dte,
-            'contracts': contracts,
-            'call_cost': call_cost * 100,
-            'put_cost': put_cost * 100,
-            'cost_per_contract': total_cost_per_contract,
-            'total_cost': total_cost,
-            'max_loss': total_cost,
-            'max_profit': 'Unlimited',
-            'breakeven_up': breakeven_up,
-            'breakeven_down': breakeven_down,
-            'breakeven_range': breakeven_up - breakeven_down,
-            'iv_rank': iv_rank
-        }
+        return LongStraddleResult(
+            strategy='LONG_STRADDLE',
+            strike=atm_strike,
+            dte=dte,
+            contracts=contracts,
+            call_cost=call_cost * 100,
+            put_cost=put_cost * 100,
+            cost_per_contract=total_cost_per_contract,
+            total_cost=total_cost,
+            max_loss=total_cost,
+            max_profit='Unlimited',
+            breakeven_up=breakeven_up,
+            breakeven_down=breakeven_down,
+            breakeven_range=breakeven_up - breakeven_down,
+            iv_rank=iv_rank
+        )
     
-    def _generate_long_strangle(self, option_chain: pd.DataFrame, features: Dict,
-                                current_price: float) -> Dict:
+    def _generate_long_strangle(self, option_chain: pd.DataFrame, features: FeatureVector,
+                                current_price: float) -> LongStrangleResult:
         """
         Generate parameters for LONG STRANGLE.
         
         Strategy: Buy OTM call + OTM put
         Best when: Low IV + Expecting big move (cheaper than straddle)
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         
         # Select DTE
         dte = self._select_optimal_dte(option_chain, 'LONG_STRANGLE', iv_rank, 'MODERATE')
         
-        # IV-adaptive strike selection
-        if iv_rank < 30:
-            # Very low IV → closer to ATM (more leverage)
-            call_delta = 0.35
-            put_delta = -0.35
-        else:
-            # Higher IV → further OTM (cheaper)
-            call_delta = 0.25
-            put_delta = -0.25
-        
-        # Find strikes
-        call_strike = self._find_strike_by_delta(option_chain, call_delta, 'call', dte)
-        put_strike = self._find_strike_by_delta(option_chain, put_delta, 'put', dte)
+        # IV-adaptive strike selection (very low IV → closer to ATM, else cheaper OTM)
+        call_delta, put_delta = _DELTA_POLICY['LONG_STRANGLE'][_iv_policy_bucket(iv_rank)]
         
-        # Get costs
-        call_cost = self._get_option_cost(option_chain, call_strike, 'call', dte)
-        put_cost = self._get_option_cost(option_chain, put_strike, 'put', dte)
+        # Find strikes and costs
+        (call_strike, _, call_cost), (put_strike, _, put_cost) = self._resolve_legs(
+            self._get_view(option_chain), dte,
+            [('call', 'delta', call_delta), ('put', 'delta', put_delta)]
+        )
         
         # Calculate metrics
         total_cost_per_contract = (call_cost + put_cost) * 100
@@ -646,69 +1183,62 @@ class ParameterGenerator:
         breakeven_up = call_strike + (call_cost + put_cost)
         breakeven_down = put_strike - (call_cost + put_cost)
         
-        return {
-            'strategy': 'LONG_STRANGLE',
-            'call_strike': call_strike,
-            'put_strike': put_strike,
-            'dte': dte,
-            'contracts': contracts,
-            'call_cost': call_cost * 100,
-            'put_cost': put_cost * 100,
-            'cost_per_contract': total_cost_per_contract,
-            'total_cost': total_cost,
-            'max_loss': total_cost,
-            'max_profit': 'Unlimited',
-            'breakeven_up': breakeven_up,
-            'breakeven_down': breakeven_down,
-            'breakeven_range': breakeven_up - breakeven_down,
-            'strike_width': call_strike - put_strike,
-            'iv_rank': iv_rank
-        }
+        return LongStrangleResult(
+            strategy='LONG_STRANGLE',
+            call_strike=call_strike,
+            put_strike=put_strike,
+            dte=dte,
+            contracts=contracts,
+            call_cost=call_cost * 100,
+            put_cost=put_cost * 100,
+            cost_per_contract=total_cost_per_contract,
+            total_cost=total_cost,
+            max_loss=total_cost,
+            max_profit='Unlimited',
+            breakeven_up=breakeven_up,
+            breakeven_down=breakeven_down,
+            breakeven_range=breakeven_up - breakeven_down,
+            strike_width=call_strike - put_strike,
+            iv_rank=iv_rank
+        )
     
-    def _generate_iron_condor(self, option_chain: pd.DataFrame, features: Dict,
-                              current_price: float) -> Dict:
+    def _generate_iron_condor(self, option_chain: pd.DataFrame, features: FeatureVector,
+                              current_price: float) -> IronCondorResult:
         """
         Generate parameters for IRON CONDOR.
         
         Strategy: Sell OTM put spread + OTM call spread
         Best when: High IV + Ranging market
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         
         # Select DTE (shorter for high IV)
         dte = self._select_optimal_dte(option_chain, 'IRON_CONDOR', iv_rank, 'WEAK')
         
-        # IV-adaptive strike selection
-        if iv_rank > 70:
-            # Very high IV → wider wings (more premium, more room)
-            put_short_delta = -0.20
-            put_long_delta = -0.10
-            call_short_delta = 0.20
-            call_long_delta = 0.10
-        else:
-            # High IV → standard wings
-            put_short_delta = -0.25
-            put_long_delta = -0.15
-            call_short_delta = 0.25
-            call_long_delta = 0.15
-        
-        # Find strikes
-        put_short_strike = self._find_strike_by_delta(option_chain, put_short_delta, 'put', dte)
-        put_long_strike = self._find_strike_by_delta(option_chain, put_long_delta, 'put', dte)
-        call_short_strike = self._find_strike_by_delta(option_chain, call_short_delta, 'call', dte)
-        call_long_strike = self._find_strike_by_delta(option_chain, call_long_delta, 'call', dte)
-        
-        # Get prices
-        put_short_credit = self._get_option_bid(option_chain, put_short_strike, 'put', dte)
-        put_long_cost = self._get_option_cost(option_chain, put_long_strike, 'put', dte)
-        call_short_credit = self._get_option_bid(option_chain, call_short_strike, 'call', dte)
-        call_long_cost = self._get_option_cost(option_chain, call_long_strike, 'call', dte)
+        # IV-adaptive strike selection (very high IV → wider wings)
+        put_short_delta, put_long_delta, call_short_delta, call_long_delta = (
+            _DELTA_POLICY['IRON_CONDOR'][_iv_policy_bucket(iv_rank)]
+        )
+        
+        # Find strikes and prices (all four legs in one pass)
+        (
+            (put_short_strike, put_short_credit, _),
+            (put_long_strike, _, put_long_cost),
+            (call_short_strike, call_short_credit, _),
+            (call_long_strike, _, call_long_cost),
+        ) = self._resolve_legs(self._get_view(option_chain), dte, [
+            ('put', 'delta', put_short_delta),
+            ('put', 'delta', put_long_delta),
+            ('call', 'delta', call_short_delta),
+            ('call', 'delta', call_long_delta),
+        ])
         
         # Calculate metrics
         net_credit = (put_short_credit + call_short_credit - put_long_cost - call_long_cost) * 100
         put_spread_width = (put_short_strike - put_long_strike) * 100
         call_spread_width = (call_long_strike - call_short_strike) * 100
-        max_loss = max(put_spread_width, call_spread_width) - net_credit
+        max_width = put_spread_width if put_spread_width > call_spread_width else call_spread_width
+        max_loss = max_width - net_credit
         
         # Position sizing
         contracts = self.risk_manager.calculate_position_size(max_loss)
@@ -717,71 +1247,64 @@ class ParameterGenerator:
         total_credit = net_credit * contracts
         total_max_loss = max_loss * contracts
         
-        return {
-            'strategy': 'IRON_CONDOR',
-            'put_short_strike': put_short_strike,
-            'put_long_strike': put_long_strike,
-            'call_short_strike': call_short_strike,
-            'call_long_strike': call_long_strike,
-            'dte': dte,
-            'contracts': contracts,
-            'net_credit': net_credit,
-            'total_credit': total_credit,
-            'max_profit': net_credit,
-            'total_max_profit': total_credit,
-            'max_loss': max_loss,
-            'total_max_loss': total_max_loss,
-            'breakeven_down': put_short_strike - (net_credit / 100),
-            'breakeven_up': call_short_strike + (net_credit / 100),
-            'profit_zone_width': call_short_strike - put_short_strike,
-            'risk_reward_ratio': net_credit / max_loss if max_loss > 0 else 0,
-            'iv_rank': iv_rank
-        }
+        return IronCondorResult(
+            strategy='IRON_CONDOR',
+            put_short_strike=put_short_strike,
+            put_long_strike=put_long_strike,
+            call_short_strike=call_short_strike,
+            call_long_strike=call_long_strike,
+            dte=dte,
+            contracts=contracts,
+            net_credit=net_credit,
+            total_credit=total_credit,
+            max_profit=net_credit,
+            total_max_profit=total_credit,
+            max_loss=max_loss,
+            total_max_loss=total_max_loss,
+            breakeven_down=put_short_strike - (net_credit / 100),
+            breakeven_up=call_short_strike + (net_credit / 100),
+            profit_zone_width=call_short_strike - put_short_strike,
+            risk_reward_ratio=net_credit / max_loss if max_loss > 0 else 0,
+            iv_rank=iv_rank
+        )
     
-    def _generate_iron_butterfly(self, option_chain: pd.DataFrame, features: Dict,
-                                 current_price: float) -> Dict:
+    def _generate_iron_butterfly(self, option_chain: pd.DataFrame, features: FeatureVector,
+                                 current_price: float) -> IronButterflyResult:
         """
         Generate parameters for IRON BUTTERFLY.
         
         Strategy: Sell ATM straddle + buy OTM strangle
         Best when: Very high IV + Very ranging market
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         
         # Select DTE (shorter for very high IV)
         dte = self._select_optimal_dte(option_chain, 'IRON_BUTTERFLY', iv_rank, 'WEAK')
         
+        view = self._get_view(option_chain)
+        
         # Find ATM strike
-        atm_strike = self._find_strike_by_delta(option_chain, 0.50, 'call', dte)
+        [(atm_strike, atm_call_credit, _)] = self._resolve_legs(
+            view, dte, [('call', 'delta', 0.50)]
+        )
         
-        # IV-adaptive wing width
-        if iv_rank > 75:
-            # Very high IV → wider wings
-            wing_pct = 0.07  # 7% wings
-        else:
-            # High IV → standard wings
-            wing_pct = 0.05  # 5% wings
+        # IV-adaptive wing width (7% in very high IV, 5% otherwise)
+        wing_pct = _WING_PCT_POLICY[_iv_policy_bucket(iv_rank)]
         
-        # Find wing strikes
-        long_put_strike = self._find_strike_by_price(
-            option_chain, atm_strike * (1 - wing_pct), 'put', dte
+        # Find wing strikes and prices
+        (long_put_strike, _, long_put_cost), (long_call_strike, _, long_call_cost) = self._resolve_legs(
+            view, dte, [
+                ('put', 'price', atm_strike * (1 - wing_pct)),
+                ('call', 'price', atm_strike * (1 + wing_pct)),
+            ]
         )
-        long_call_strike = self._find_strike_by_price(
-            option_chain, atm_strike * (1 + wing_pct), 'call', dte
-        )
-        
-        # Get prices
-        atm_put_credit = self._get_option_bid(option_chain, atm_strike, 'put', dte)
-        atm_call_credit = self._get_option_bid(option_chain, atm_strike, 'call', dte)
-        long_put_cost = self._get_option_cost(option_chain, long_put_strike, 'put', dte)
-        long_call_cost = self._get_option_cost(option_chain, long_call_strike, 'call', dte)
+        atm_put_credit = view.find_price(atm_strike, 'put', dte, 'bid')
         
         # Calculate metrics
         net_credit = (atm_put_credit + atm_call_credit - long_put_cost - long_call_cost) * 100
-        wing_width = max(
-            (atm_strike - long_put_strike) * 100,
-            (long_call_strike - atm_strike) * 100
-        )
+        put_wing = (atm_strike - long_put_strike) * 100
+        call_wing = (long_call_strike - atm_strike) * 100
+        wing_width = put_wing if put_wing > call_wing else call_wing
         max_loss = wing_width - net_credit
         
         # Position sizing
@@ -791,55 +1314,57 @@ class ParameterGenerator:
         total_credit = net_credit * contracts
         total_max_loss = max_loss * contracts
         
-        return {
-            'strategy': 'IRON_BUTTERFLY',
-            'center_strike': atm_strike,
-            'long_put_strike': long_put_strike,
-            'long_call_strike': long_call_strike,
-            'dte': dte,
-            'contracts': contracts,
-            'net_credit': net_credit,
-            'total_credit': total_credit,
-            'max_profit': net_credit,
-            'total_max_profit': total_credit,
-            'max_loss': max_loss,
-            'total_max_loss': total_max_loss,
-            'breakeven_down': atm_strike - (net_credit / 100),
-            'breakeven_up': atm_strike + (net_credit / 100),
-            'profit_zone_width': (net_credit / 100) * 2,
-            'wing_width': wing_width / 100,
-            'risk_reward_ratio': net_credit / max_loss if max_loss > 0 else 0,
-            'iv_rank': iv_rank
-        }
+        return IronButterflyResult(
+            strategy='IRON_BUTTERFLY',
+            center_strike=atm_strike,
+            long_put_strike=long_put_strike,
+            long_call_strike=long_call_strike,
+            dte=dte,
+            contracts=contracts,
+            net_credit=net_credit,
+            total_credit=total_credit,
+            max_profit=net_credit,
+            total_max_profit=total_credit,
+            max_loss=max_loss,
+            total_max_loss=total_max_loss,
+            breakeven_down=atm_strike - (net_credit / 100),
+            breakeven_up=atm_strike + (net_credit / 100),
+            profit_zone_width=(net_credit / 100) * 2,
+            wing_width=wing_width / 100,
+            risk_reward_ratio=net_credit / max_loss if max_loss > 0 else 0,
+            iv_rank=iv_rank
+        )
     
-    def _generate_calendar_spread(self, option_chain: pd.DataFrame, features: Dict,
-                                  current_price: float) -> Dict:
+    def _generate_calendar_spread(self, option_chain: pd.DataFrame, features: FeatureVector,
+                                  current_price: float) -> CalendarSpreadResult:
         """
         Generate parameters for CALENDAR SPREAD.
         
         Strategy: Sell near-term option, buy far-term option (same strike)
         Best when: Low IV + Neutral outlook
         """
-        iv_rank = features.get('iv_rank', 50)
+        iv_rank = features.iv_rank
         
-        # Find available DTEs
-        available_dtes = sorted(option_chain['dte'].unique())
+        view = self._get_view(option_chain)
+        
+        # Find available DTEs (sorted)
+        available_dtes = view.unique_dtes
         
         # Select near and far DTE
-        near_dte = min(available_dtes, key=lambda x: abs(x - 21))  # ~3 weeks
-        far_dte = min([d for d in available_dtes if d > near_dte + 14], 
-                     key=lambda x: abs(x - 45), default=near_dte + 30)  # ~6 weeks
+        near_dte = _nearest_dte(available_dtes, 21)  # ~3 weeks
+        later_dtes = available_dtes[available_dtes > near_dte + 14]
+        far_dte = _nearest_dte(later_dtes, 45) if len(later_dtes) else near_dte + 30  # ~6 weeks
         
         # Find ATM strike
         atm_strike = self._find_strike_by_delta(option_chain, 0.50, 'call', near_dte)
         
         # Determine call or put based on slight bias
-        rsi = features.get('rsi_14', 50)
+        rsi = features.rsi_14
         option_type = 'call' if rsi > 50 else 'put'
         
-        # Get prices
-        near_credit = self._get_option_bid(option_chain, atm_strike, option_type, near_dte)
-        far_cost = self._get_option_cost(option_chain, atm_strike, option_type, far_dte)
+        # Get prices (both legs from the view's (type, dte, strike) price index)
+        near_credit = view.find_price(atm_strike, option_type, near_dte, 'bid')
+        far_cost = view.find_price(atm_strike, option_type, far_dte, 'ask')
         
         # Calculate metrics
         net_debit = (far_cost - near_credit) * 100
@@ -850,40 +1375,40 @@ class ParameterGenerator:
         # Calculate totals
         total_debit = net_debit * contracts
         
-        return {
-            'strategy': 'CALENDAR_SPREAD',
-            'strike': atm_strike,
-            'option_type': option_type.upper(),
-            'near_dte': near_dte,
-            'far_dte': far_dte,
-            'contracts': contracts,
-            'net_debit': net_debit,
-            'total_debit': total_debit,
-            'max_loss': net_debit,
-            'total_max_loss': total_debit,
-            'max_profit': 'Variable (depends on IV expansion)',
-            'note': 'Profit maximized if price stays near strike at near expiration',
-            'iv_rank': iv_rank
-        }
+        return CalendarSpreadResult(
+            strategy='CALENDAR_SPREAD',
+            strike=atm_strike,
+            option_type=option_type.upper(),
+            near_dte=near_dte,
+            far_dte=far_dte,
+            contracts=contracts,
+            net_debit=net_debit,
+            total_debit=total_debit,
+            max_loss=net_debit,
+            total_max_loss=total_debit,
+            max_profit='Variable (depends on IV expansion)',
+            note='Profit maximized if price stays near strike at near expiration',
+            iv_rank=iv_rank
+        )
     
-    def _generate_diagonal_spread(self, option_chain: pd.DataFrame, features: Dict,
-                                  current_price: float) -> Dict:
+    def _generate_diagonal_spread(self, option_chain: pd.DataFrame, features: FeatureVector,
+                                  current_price: float) -> DiagonalSpreadResult:
         """
         Generate parameters for DIAGONAL SPREAD.
         
         Strategy: Sell near-term OTM option, buy far-term ATM option
         Best when: Medium IV + Slight directional bias
         """
-        iv_rank = features.get('iv_rank', 50)
-        rsi = features.get('rsi_14', 50)
+        iv_rank = features.iv_rank
+        rsi = features.rsi_14
         
-        # Find available DTEs
-        available_dtes = sorted(option_chain['dte'].unique())
+        # Find available DTEs (sorted)
+        available_dtes = self._get_view(option_chain).unique_dtes
         
         # Select near and far DTE
-        near_dte = min(available_dtes, key=lambda x: abs(x - 21))
-        far_dte = min([d for d in available_dtes if d > near_dte + 14],
-                     key=lambda x: abs(x - 45), default=near_dte + 30)
+        near_dte = _nearest_dte(available_dtes, 21)
+        later_dtes = available_dtes[available_dtes > near_dte + 14]
+        far_dte = _nearest_dte(later_dtes, 45) if len(later_dtes) else near_dte + 30
         
         # Determine direction based on bias
         if rsi > 55:
@@ -897,13 +1422,14 @@ class ParameterGenerator:
             long_delta = -0.50  # ATM
             short_delta = -0.30  # OTM
         
-        # Find strikes
-        long_strike = self._find_strike_by_delta(option_chain, long_delta, option_type, far_dte)
-        short_strike = self._find_strike_by_delta(option_chain, short_delta, option_type, near_dte)
-        
-        # Get prices
-        long_cost = self._get_option_cost(option_chain, long_strike, option_type, far_dte)
-        short_credit = self._get_option_bid(option_chain, short_strike, option_type, near_dte)
+        # Find strikes and prices (each leg from its own expiry's bucket)
+        view = self._get_view(option_chain)
+        (long_strike, _, long_cost), = self._resolve_legs(
+            view, far_dte, [(option_type, 'delta', long_delta)]
+        )
+        (short_strike, short_credit, _), = self._resolve_legs(
+            view, near_dte, [(option_type, 'delta', short_delta)]
+        )
         
         # Calculate metrics
         net_debit = (long_cost - short_credit) * 100
@@ -914,23 +1440,23 @@ class ParameterGenerator:
         # Calculate totals
         total_debit = net_debit * contracts
         
-        return {
-            'strategy': 'DIAGONAL_SPREAD',
-            'option_type': option_type.upper(),
-            'long_strike': long_strike,
-            'short_strike': short_strike,
-            'near_dte': near_dte,
-            'far_dte': far_dte,
-            'contracts': contracts,
-            'net_debit': net_debit,
-            'total_debit': total_debit,
-            'max_loss': net_debit,
-            'total_max_loss': total_debit,
-            'max_profit': 'Variable (depends on price movement and IV)',
-            'bias': 'Bullish' if option_type == 'call' else 'Bearish',
-            'note': 'Roll short option at expiration to continue position',
-            'iv_rank': iv_rank
-        }
+        return DiagonalSpreadResult(
+            strategy='DIAGONAL_SPREAD',
+            option_type=option_type.upper(),
+            long_strike=long_strike,
+            short_strike=short_strike,
+            near_dte=near_dte,
+            far_dte=far_dte,
+            contracts=contracts,
+            net_debit=net_debit,
+            total_debit=total_debit,
+            max_loss=net_debit,
+            total_max_loss=total_debit,
+            max_profit='Variable (depends on price movement and IV)',
+            bias='Bullish' if option_type == 'call' else 'Bearish',
+            note='Roll short option at expiration to continue position',
+            iv_rank=iv_rank
+        )
 
 
 # Example usage
@@ -6,8 +6,126 @@ Fix the broken iv_rank values from Massive.com API
 import pandas as pd
 import numpy as np
 
+import os
+import sys
 
-def recalculate_iv_rank(df, lookback_days=252):
+if not __package__:
+    # Run directly as a script: make the repo root importable for scripts.utils
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.utils._kernels import njit, NUMBA_AVAILABLE
+
+# Optional fast moving-window kernels
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+# Optional Arrow CSV/Parquet writers
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+@njit(cache=True)
+def _iv_rank_fused(iv, window, min_periods, out):
+    """
+    Rolling high/low and IV rank in one pass over iv
+    
+    Keeps two monotonic deques of row indices (rolling max and min
+    candidates). NaN values are skipped and do not count toward
+    min_periods, as in pandas rolling.
+    
+    Args:
+        iv: IV values in date order
+        window: Rolling window (rows)
+        min_periods: Minimum non-NaN values in the window
+        out: Output array for the IV rank (0-100, NaN before min_periods)
+    """
+    n = iv.shape[0]
+    dq_hi = np.empty(n, dtype=np.int64)
+    dq_lo = np.empty(n, dtype=np.int64)
+    hi_head = hi_tail = lo_head = lo_tail = 0
+    count = 0
+    
+    for i in range(n):
+        x = iv[i]
+        
+        # Push i, dropping the candidates it dominates
+        if not np.isnan(x):
+            count += 1
+            while hi_tail > hi_head and iv[dq_hi[hi_tail - 1]] <= x:
+                hi_tail -= 1
+            dq_hi[hi_tail] = i
+            hi_tail += 1
+            while lo_tail > lo_head and iv[dq_lo[lo_tail - 1]] >= x:
+                lo_tail -= 1
+            dq_lo[lo_tail] = i
+            lo_tail += 1
+        
+        # Drop the row leaving the window (at most the front of each deque)
+        j = i - window
+        if j >= 0:
+            if not np.isnan(iv[j]):
+                count -= 1
+            if hi_tail > hi_head and dq_hi[hi_head] == j:
+                hi_head += 1
+            if lo_tail > lo_head and dq_lo[lo_head] == j:
+                lo_head += 1
+        
+        if count == 0 or count < min_periods:
+            out[i] = np.nan
+            continue
+        
+        hi = iv[dq_hi[hi_head]]
+        lo = iv[dq_lo[lo_head]]
+        
+        # If high == low (no variation), 50 (neutral); else clip to 0-100
+        if hi == lo:
+            out[i] = 50.0
+        else:
+            rank = (x - lo) / (hi - lo) * 100
+            if rank < 0:
+                rank = 0.0
+            elif rank > 100:
+                rank = 100.0
+            out[i] = rank
+
+
+def _rolling_max_min(values, window, min_periods):
+    """
+    Trailing rolling max and min of a float array
+    
+    Same results as pandas rolling(window, min_periods).max()/.min(), using
+    bottleneck's O(n) moving-window kernels when available.
+    
+    Returns:
+        tuple: (rolling_max, rolling_min) arrays in the dtype of values
+            (NaN until min_periods values)
+    """
+    if not BOTTLENECK_AVAILABLE:
+        rolling = pd.Series(values).rolling(window=window, min_periods=min_periods)
+        return rolling.max().to_numpy(dtype=values.dtype), rolling.min().to_numpy(dtype=values.dtype)
+    
+    if min_periods > window:
+        raise ValueError(f"min_periods {min_periods} must be <= window {window}")
+    
+    # bottleneck needs window <= len(values); fewer than min_periods rows is all NaN
+    if len(values) < min_periods:
+        return np.full(len(values), np.nan, dtype=values.dtype), np.full(len(values), np.nan, dtype=values.dtype)
+    
+    window = min(window, len(values))
+    return (bn.move_max(values, window, min_count=min_periods),
+            bn.move_min(values, window, min_count=min_periods))
+
+
+def recalculate_iv_rank(df, lookback_days=252, dtype=np.float64):
     """
     Recalculate IV Rank using proper formula
     
@@ -16,31 +134,54 @@ def recalculate_iv_rank(df, lookback_days=252):
     Args:
         df: DataFrame with 'date' and 'iv_atm' columns
         lookback_days: Rolling window for min/max (default 252 = 1 year)
+        dtype: Float dtype for the computation and result (np.float32 halves
+            memory traffic; ranks then agree with float64 to ~1e-5)
     
     Returns:
         Series with corrected IV Rank values (0-100)
     """
-    # Sort by date
-    df = df.sort_values('date').copy()
+    # Sort by date (only the IV array; usually already sorted)
+    iv = df['iv_atm'].to_numpy(dtype=dtype)
+    index = df.index
+    
+    if not df['date'].is_monotonic_increasing:
+        order = np.argsort(df['date'].to_numpy(), kind='stable')
+        iv = iv[order]
+        index = index[order]
+    
+    # Leading NaNs (IV history starting late) never enter a window, so only
+    # the tail from the first valid IV is computed; the prefix stays NaN
+    is_valid = ~np.isnan(iv)
+    start = int(is_valid.argmax()) if is_valid.any() else len(iv)
+    iv_rank = np.full_like(iv, np.nan)
+    iv = iv[start:]
+    
+    if NUMBA_AVAILABLE:
+        # Rolling 52-week high/low and IV Rank fused into one compiled pass
+        if lookback_days < 30:
+            raise ValueError(f"min_periods 30 must be <= window {lookback_days}")
+        _iv_rank_fused(iv, lookback_days, 30, iv_rank[start:])
+        return pd.Series(iv_rank, index=index, name='iv_rank_corrected')
     
     # Calculate rolling 52-week high and low
-    df['iv_52w_high'] = df['iv_atm'].rolling(window=lookback_days, min_periods=30).max()
-    df['iv_52w_low'] = df['iv_atm'].rolling(window=lookback_days, min_periods=30).min()
+    iv_52w_high, iv_52w_low = _rolling_max_min(iv, lookback_days, 30)
     
-    # Calculate IV Rank
-    df['iv_rank_corrected'] = (
-        (df['iv_atm'] - df['iv_52w_low']) / 
-        (df['iv_52w_high'] - df['iv_52w_low']) * 100
-    )
+    # Calculate IV Rank (in place in the tail of the output buffer)
+    flat = iv_52w_high == iv_52w_low
+    tail = iv_rank[start:]
+    np.subtract(iv, iv_52w_low, out=tail)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        np.divide(tail, iv_52w_high - iv_52w_low, out=tail)
+    np.multiply(tail, 100, out=tail)
     
     # Handle edge cases
     # If high == low (no variation), set to 50 (neutral)
-    df.loc[df['iv_52w_high'] == df['iv_52w_low'], 'iv_rank_corrected'] = 50.0
+    tail[flat] = 50.0
     
     # Clip to 0-100 range
-    df['iv_rank_corrected'] = df['iv_rank_corrected'].clip(0, 100)
+    np.clip(tail, 0, 100, out=tail)
     
-    return df['iv_rank_corrected']
+    return pd.Series(iv_rank, index=index, name='iv_rank_corrected')
 
 
 def compare_iv_metrics(features_path):
@@ -59,20 +200,26 @@ def compare_iv_metrics(features_path):
     print()
     
     # Compare distributions
-    metrics = ['iv_rank', 'iv_percentile', 'iv_rank_corrected']
-    
-    for metric in metrics:
-        if metric in df.columns:
-            print(f"{metric}:")
-            print(f"  Min:    {df[metric].min():.2f}")
-            print(f"  Max:    {df[metric].max():.2f}")
-            print(f"  Mean:   {df[metric].mean():.2f}")
-            print(f"  Std:    {df[metric].std():.2f}")
-            print(f"  Unique: {df[metric].nunique()}")
-            print(f"  > 50:   {(df[metric] > 50).sum()} days")
-            print(f"  > 70:   {(df[metric] > 70).sum()} days")
-            print(f"  < 30:   {(df[metric] < 30).sum()} days")
-            print()
+    metrics = [m for m in ['iv_rank', 'iv_percentile', 'iv_rank_corrected'] if m in df.columns]
+    
+    # All summary stats and threshold counts in one pass per reduction
+    stats = df[metrics].agg(['min', 'max', 'mean', 'std', 'nunique'])
+    values = df[metrics].to_numpy(dtype=np.float64)
+    above_50 = (values > 50).sum(axis=0)
+    above_70 = (values > 70).sum(axis=0)
+    below_30 = (values < 30).sum(axis=0)
+    
+    for i, metric in enumerate(metrics):
+        print(f"{metric}:")
+        print(f"  Min:    {stats.at['min', metric]:.2f}")
+        print(f"  Max:    {stats.at['max', metric]:.2f}")
+        print(f"  Mean:   {stats.at['mean', metric]:.2f}")
+        print(f"  Std:    {stats.at['std', metric]:.2f}")
+        print(f"  Unique: {int(stats.at['nunique', metric])}")
+        print(f"  > 50:   {above_50[i]} days")
+        print(f"  > 70:   {above_70[i]} days")
+        print(f"  < 30:   {below_30[i]} days")
+        print()
     
     # Check correlation
     print("Correlations:")
@@ -83,8 +230,47 @@ def compare_iv_metrics(features_path):
     
     # Save corrected version
     output_path = features_path.replace('.csv', '_with_corrected_iv.csv')
-    df.to_csv(output_path, index=False)
-    print(f"✓ Saved corrected data to: {output_path}")
+    
+    table = None
+    if PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object columns (e.g. after a read_csv DtypeWarning) have no Arrow type
+            table = None
+    
+    if table is not None:
+        # Arrow writers: streamed CSV plus a Parquet sidecar for fast columnar reads
+        parquet_path = output_path.replace('.csv', '.parquet')
+        pq.write_table(table, parquet_path)
+        
+        # Keep the CSV in the pandas format: midnight timestamps as plain dates,
+        # booleans as True/False
+        dates = df['date']
+        if (dates.isna() | (dates == dates.dt.normalize())).all():
+            i = table.schema.get_field_index('date')
+            table = table.set_column(i, 'date', table.column(i).cast(pa.date32()))
+        for i, field in enumerate(table.schema):
+            if pa.types.is_boolean(field.type):
+                table = table.set_column(i, field.name, pc.if_else(table.column(i), 'True', 'False'))
+        
+        # Header from pandas and unquoted rows, as df.to_csv writes them. Arrow
+        # can only quote every string, so a value that needs quoting falls
+        # back to the pandas writer
+        try:
+            with open(output_path, 'w', newline='') as f:
+                f.write(df.iloc[:0].to_csv(index=False))
+                f.flush()
+                pacsv.write_csv(table, f.buffer,
+                                pacsv.WriteOptions(include_header=False, quoting_style='none'))
+        except pa.ArrowInvalid:
+            df.to_csv(output_path, index=False)
+        
+        print(f"✓ Saved corrected data to: {output_path}")
+        print(f"✓ Saved Parquet copy to: {parquet_path}")
+    else:
+        df.to_csv(output_path, index=False)
+        print(f"✓ Saved corrected data to: {output_path}")
     
     return df
 
@@ -18,52 +18,111 @@ Expected improvement: 5/10 → 8-9/10 strategies in range
 Backup of v5.0 available at: strategy_selector_v5_backup.py
 """
 
+from collections import namedtuple
 
-def select_strategy_from_features(features):
+import numpy as np
+import pandas as pd
+
+import os
+import sys
+
+if not __package__:
+    # Run directly as a script: make the repo root importable for scripts.utils
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.utils._kernels import njit, prange, NUMBA_AVAILABLE
+
+
+# All strategies the rules can return, in strategy-ID order
+STRATEGY_NAMES = (
+    'IRON_CONDOR',
+    'LONG_CALL',
+    'LONG_PUT',
+    'IRON_BUTTERFLY',
+    'BULL_CALL_SPREAD',
+    'BEAR_PUT_SPREAD',
+    'LONG_STRADDLE',
+    'LONG_STRANGLE',
+    'CALENDAR_SPREAD',
+    'DIAGONAL_SPREAD',
+)
+
+# Strategy IDs (indices into STRATEGY_NAMES) returned by the compiled rules
+(_IRON_CONDOR, _LONG_CALL, _LONG_PUT, _IRON_BUTTERFLY, _BULL_CALL_SPREAD, _BEAR_PUT_SPREAD,
+ _LONG_STRADDLE, _LONG_STRANGLE, _CALENDAR_SPREAD, _DIAGONAL_SPREAD) = range(len(STRATEGY_NAMES))
+
+# Features read by the rules, with the defaults used when one is missing
+_FEATURE_DEFAULTS = (
+    ('iv_rank', 50),
+    ('adx_14', 20),
+    ('trend_regime', 2),
+    ('rsi_14', 50),
+    ('price_vs_sma_20', 0),
+)
+
+# Fixed-schema feature record (e.g. from df.itertuples(index=False, name='FeatureRow'))
+FeatureRow = namedtuple('FeatureRow', [column for column, _ in _FEATURE_DEFAULTS])
+
+
+def _fallback_strategy(iv_rank, rsi, adx):
     """
-    Single-tier rule-based strategy selection
+    FINAL FALLBACK of the rules, for days that don't match any specific rule
     
-    SIMPLIFIED APPROACH:
-    - One rule per strategy (no PRIORITY vs BROADER conflicts)
-    - Predictable outcomes (adjust one threshold = immediate effect)
-    - Easier to maintain and tune
-    
-    Args:
-        features (dict): Dictionary containing market features:
-            - iv_rank: Implied Volatility Rank (0-100)
-            - adx_14: Average Directional Index (0-100)
-            - trend_regime: Trend classification (0-4)
-            - rsi_14: Relative Strength Index (0-100)
-            - price_vs_sma_20: Price relative to 20-day SMA (-0.20 to +0.20)
+    Reference implementation used to build _FALLBACK_LUT at import.
     
     Returns:
-        str: Strategy name (one of 10 strategies)
+        int: Strategy ID
+    """
+    # V6: More selective - require stronger signals for spreads
+    # Otherwise default to neutral strategy
     
-    Target distribution:
-        - IRON_CONDOR: 20-30% (High IV + Ranging)
-        - LONG_CALL: 15-20% (Low IV + Strong Uptrend)
-        - LONG_PUT: 15-20% (Low IV + Strong Downtrend)
-        - IRON_BUTTERFLY: 10-15% (Very High IV + Ranging)
-        - BULL_CALL_SPREAD: 10-15% (Medium IV + Moderate Bullish)
-        - BEAR_PUT_SPREAD: 10-15% (Medium IV + Moderate Bearish)
-        - LONG_STRADDLE: 5-10% (Low IV + Neutral)
-        - LONG_STRANGLE: 5-10% (Low IV + Neutral)
-        - CALENDAR_SPREAD: 3-5% (Low IV + Very Neutral)
-        - DIAGONAL_SPREAD: 3-5% (Medium IV + Slight bias)
+    if iv_rank > 55:
+        # High IV = sell premium
+        return _IRON_CONDOR
+    elif iv_rank < 35:
+        # Low IV = buy options
+        if rsi >= 50:
+            return _LONG_CALL
+        else:
+            return _LONG_PUT
+    else:
+        # Medium IV (35-55): Be more selective for spreads
+        if rsi > 58 and adx > 18:  # Strong bullish momentum
+            return _BULL_CALL_SPREAD
+        elif rsi < 42 and adx > 18:  # Strong bearish momentum
+            return _BEAR_PUT_SPREAD
+        else:
+            # Weak signals in medium IV → default to neutral strategy
+            return _IRON_CONDOR
+
+
+# Fallback strategy ID per bucket, evaluated once at a representative point:
+#   iv_rank: 0 (<35), 1 (35-55, or NaN), 2 (>55)
+#   rsi:     0 (<42), 1 (42-50, or NaN), 2 (50-58), 3 (>58)
+#   adx:     0 (<=18, or NaN), 1 (>18)
+_FALLBACK_LUT = np.array([
+    [[_fallback_strategy(iv_rank, rsi, adx) for adx in (10, 25)] for rsi in (30, 45, 55, 70)]
+    for iv_rank in (20, 45, 60)
+], dtype=np.int8)
+
+
+@njit(cache=True, fastmath=False)
+def _select_strategy_nb(iv_rank, adx, trend_regime, rsi, price_vs_sma):
     """
-    # Extract features
-    iv_rank = features.get('iv_rank', 50)
-    adx = features.get('adx_14', 20)
-    trend_regime = features.get('trend_regime', 2)
-    rsi = features.get('rsi_14', 50)
-    price_vs_sma = features.get('price_vs_sma_20', 0)
+    Compiled rules cascade (see select_strategy_from_features)
     
+    fastmath stays off: the thresholds are exact and NaN features must
+    compare False, as in plain Python.
+    
+    Returns:
+        int: Strategy ID (index into STRATEGY_NAMES)
+    """
     # ========================================================================
     # RULE 1: Diagonal Spread (Check first - most specific)
     # ========================================================================
     # Medium IV + Neutral trend + Slight bias + Low ADX
     if 45 < iv_rank < 60 and trend_regime == 2 and 0.005 < abs(price_vs_sma) < 0.012 and adx < 15:
-        return 'DIAGONAL_SPREAD'
+        return _DIAGONAL_SPREAD
     
     # ========================================================================
     # RULE 2: Iron Condor (Most common - 20-30%)
@@ -73,7 +132,7 @@ def select_strategy_from_features(features):
     # market is ranging (low ADX). Neutral RSI confirms no directional bias.
     # This is the bread-and-butter strategy for high IV environments.
     if 52 < iv_rank < 75 and adx < 25 and 45 < rsi < 55:
-        return 'IRON_CONDOR'
+        return _IRON_CONDOR
     
     # ========================================================================
     # RULE 3: Iron Butterfly (10-15%)
@@ -83,7 +142,7 @@ def select_strategy_from_features(features):
     # Tighter profit zone than IC but higher premium collected. Requires more
     # precise market stability prediction.
     if iv_rank > 68 and adx < 20:
-        return 'IRON_BUTTERFLY'
+        return _IRON_BUTTERFLY
     
     # ========================================================================
     # RULE 4: Long Call (15-20%)
@@ -94,7 +153,7 @@ def select_strategy_from_features(features):
     # V6: Slightly relaxed to reach 15-20% target
     if iv_rank < 46 and adx > 21:  # Relaxed by 1 point each
         if trend_regime >= 3 and rsi > 54:  # RSI relaxed from 55 to 54
-            return 'LONG_CALL'
+            return _LONG_CALL
     
     # ========================================================================
     # RULE 5: Long Put (15-20%)
@@ -105,13 +164,13 @@ def select_strategy_from_features(features):
     if iv_rank < 48:  # Slightly broader - still "cheap options"
         # Path 1: Strong bearish trend (original condition)
         if adx > 20 and (trend_regime <= 1 or rsi < 42 or price_vs_sma < -0.025):
-            return 'LONG_PUT'
+            return _LONG_PUT
         # Path 2: Moderate trend but clear bearish signals
         elif adx >= 15 and (rsi < 38 or price_vs_sma < -0.035):
-            return 'LONG_PUT'
+            return _LONG_PUT
         # Path 3: Very oversold (regardless of trend)
         elif rsi < 33:
-            return 'LONG_PUT'
+            return _LONG_PUT
     
     # ========================================================================
     # RULE 6: Bull Call Spread (10-15%)
@@ -121,7 +180,7 @@ def select_strategy_from_features(features):
     # but trend is bullish. Defined risk strategy.
     # V6: Tightened all thresholds to prevent overuse
     if 56 <= iv_rank <= 63 and trend_regime >= 3 and adx > 26 and rsi > 62:
-        return 'BULL_CALL_SPREAD'
+        return _BULL_CALL_SPREAD
     
     # ========================================================================
     # RULE 7: Bear Put Spread (10-15%)
@@ -130,7 +189,7 @@ def select_strategy_from_features(features):
     # REALISTIC: Use spreads when IV is elevated but trend is bearish
     # Defined risk, lower cost than long puts in medium IV
     if 54 <= iv_rank <= 65 and trend_regime <= 1 and adx > 22 and rsi < 45:
-        return 'BEAR_PUT_SPREAD'
+        return _BEAR_PUT_SPREAD
     
     # ========================================================================
     # RULE 8: Long Straddle (5-10%)
@@ -138,7 +197,7 @@ def select_strategy_from_features(features):
     # Low IV + Very Neutral + Very Ranging
     if iv_rank < 35 and 45 < rsi < 58:
         if adx < 17:
-            return 'LONG_STRADDLE'
+            return _LONG_STRADDLE
     
     # ========================================================================
     # RULE 9: Long Strangle (5-10%)
@@ -148,7 +207,7 @@ def select_strategy_from_features(features):
     # but uncertain of direction. Cheaper than straddle (OTM options)
     if iv_rank < 36 and 44 < rsi < 59:
         if adx < 25:  # Slightly more lenient for ranging markets
-            return 'LONG_STRANGLE'
+            return _LONG_STRANGLE
     
     # ========================================================================
     # RULE 10: Calendar Spread (3-5%)
@@ -158,32 +217,187 @@ def select_strategy_from_features(features):
     # Profit from theta decay as near-term option loses value faster
     # V6: Slightly relaxed all conditions to reach 3-5% target
     if iv_rank < 42 and adx < 20 and 42 < rsi < 58 and abs(price_vs_sma) < 0.022:
-        return 'CALENDAR_SPREAD'
+        return _CALENDAR_SPREAD
     
     # ========================================================================
     # FINAL FALLBACK: For days that don't match any specific rule
     # ========================================================================
-    # V6: More selective - require stronger signals for spreads
-    # Otherwise default to neutral strategy
+    # Branchless: table lookup on the (IV, RSI, ADX) buckets (see _fallback_strategy)
+    iv_bucket = 1 + (iv_rank > 55) - (iv_rank < 35)
+    rsi_bucket = 1 + (rsi >= 50) + (rsi > 58) - (rsi < 42)
+    adx_bucket = 1 * (adx > 18)
+    return _FALLBACK_LUT[iv_bucket, rsi_bucket, adx_bucket]
+
+
+@njit(cache=True, parallel=True)
+def _select_many(iv_rank, adx, trend_regime, rsi, price_vs_sma, out):
+    """Apply _select_strategy_nb to every row, writing int8 strategy IDs into out"""
+    for i in prange(out.shape[0]):
+        out[i] = _select_strategy_nb(iv_rank[i], adx[i], trend_regime[i], rsi[i], price_vs_sma[i])
+
+
+def select_strategy_from_features(features):
+    """
+    Single-tier rule-based strategy selection
     
-    if iv_rank > 55:
-        # High IV = sell premium
-        return 'IRON_CONDOR'
-    elif iv_rank < 35:
-        # Low IV = buy options
-        if rsi >= 50:
-            return 'LONG_CALL'
-        else:
-            return 'LONG_PUT'
+    SIMPLIFIED APPROACH:
+    - One rule per strategy (no PRIORITY vs BROADER conflicts)
+    - Predictable outcomes (adjust one threshold = immediate effect)
+    - Easier to maintain and tune
+    
+    Args:
+        features (dict): Dictionary containing market features:
+            - iv_rank: Implied Volatility Rank (0-100)
+            - adx_14: Average Directional Index (0-100)
+            - trend_regime: Trend classification (0-4)
+            - rsi_14: Relative Strength Index (0-100)
+            - price_vs_sma_20: Price relative to 20-day SMA (-0.20 to +0.20)
+    
+    Returns:
+        str: Strategy name (one of 10 strategies)
+    
+    Target distribution:
+        - IRON_CONDOR: 20-30% (High IV + Ranging)
+        - LONG_CALL: 15-20% (Low IV + Strong Uptrend)
+        - LONG_PUT: 15-20% (Low IV + Strong Downtrend)
+        - IRON_BUTTERFLY: 10-15% (Very High IV + Ranging)
+        - BULL_CALL_SPREAD: 10-15% (Medium IV + Moderate Bullish)
+        - BEAR_PUT_SPREAD: 10-15% (Medium IV + Moderate Bearish)
+        - LONG_STRADDLE: 5-10% (Low IV + Neutral)
+        - LONG_STRANGLE: 5-10% (Low IV + Neutral)
+        - CALENDAR_SPREAD: 3-5% (Low IV + Very Neutral)
+        - DIAGONAL_SPREAD: 3-5% (Medium IV + Slight bias)
+    """
+    return STRATEGY_NAMES[select_strategy_id(features)]
+
+
+def select_strategy_id(features):
+    """
+    Integer-coded select_strategy_from_features (no string at all)
+    
+    Args:
+        features (dict or tuple): Market features; a FeatureRow (or any
+            namedtuple with its fields) skips the dict lookups, and a plain
+            tuple is read positionally in FeatureRow field order
+    
+    Returns:
+        int: Strategy ID (index into STRATEGY_NAMES)
+    """
+    # Extract features
+    if isinstance(features, tuple):
+        if not hasattr(features, '_fields'):
+            features = FeatureRow._make(features)
+        return int(_select_strategy_nb(float(features.iv_rank), float(features.adx_14),
+                                       float(features.trend_regime), float(features.rsi_14),
+                                       float(features.price_vs_sma_20)))
+    
+    return int(_select_strategy_nb(
+        float(features.get('iv_rank', 50)),
+        float(features.get('adx_14', 20)),
+        float(features.get('trend_regime', 2)),
+        float(features.get('rsi_14', 50)),
+        float(features.get('price_vs_sma_20', 0))
+    ))
+
+
+def _feature_array(features_df, column, default):
+    """Feature column as float64 (filled with the default if missing)"""
+    if column in features_df.columns:
+        return features_df[column].to_numpy(dtype=np.float64)
+    return np.full(len(features_df), default, dtype=np.float64)
+
+
+def select_strategy_batch(features_df):
+    """
+    Vectorized select_strategy_from_features for a whole features DataFrame
+    
+    Runs the compiled cascade over all rows (in parallel) when Numba is
+    installed, otherwise evaluates each rule once as a boolean mask over the
+    feature columns. Either way the first matching rule wins per row.
+    
+    Args:
+        features_df (pd.DataFrame): One row per day with the feature columns
+            (missing columns use the same defaults as the per-row function)
+    
+    Returns:
+        pd.Series: Categorical strategy names aligned with features_df.index
+    """
+    iv_rank, adx, trend_regime, rsi, price_vs_sma = (
+        _feature_array(features_df, column, default) for column, default in _FEATURE_DEFAULTS
+    )
+    
+    if NUMBA_AVAILABLE:
+        # Compiled cascade, rows in parallel
+        codes = np.empty(len(features_df), dtype=np.int8)
+        _select_many(iv_rank, adx, trend_regime, rsi, price_vs_sma, codes)
     else:
-        # Medium IV (35-55): Be more selective for spreads
-        if rsi > 58 and adx > 18:  # Strong bullish momentum
-            return 'BULL_CALL_SPREAD'
-        elif rsi < 42 and adx > 18:  # Strong bearish momentum
-            return 'BEAR_PUT_SPREAD'
-        else:
-            # Weak signals in medium IV → default to neutral strategy
-            return 'IRON_CONDOR'
+        codes = _select_masked(iv_rank, adx, trend_regime, rsi, price_vs_sma)
+    
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=STRATEGY_NAMES),
+        index=features_df.index,
+        name='strategy'
+    )
+
+
+def _select_masked(iv_rank, adx, trend_regime, rsi, price_vs_sma):
+    """
+    NumPy version of the rules cascade: one boolean mask per rule
+    
+    Returns:
+        np.ndarray: Strategy IDs (first matching rule per row)
+    """
+    abs_pvs = np.abs(price_vs_sma)
+    
+    # (strategy, mask) in rule priority order
+    rules = [
+        # RULE 1: Diagonal Spread
+        ('DIAGONAL_SPREAD', (iv_rank > 45) & (iv_rank < 60) & (trend_regime == 2) &
+                            (abs_pvs > 0.005) & (abs_pvs < 0.012) & (adx < 15)),
+        # RULE 2: Iron Condor
+        ('IRON_CONDOR', (iv_rank > 52) & (iv_rank < 75) & (adx < 25) & (rsi > 45) & (rsi < 55)),
+        # RULE 3: Iron Butterfly
+        ('IRON_BUTTERFLY', (iv_rank > 68) & (adx < 20)),
+        # RULE 4: Long Call
+        ('LONG_CALL', (iv_rank < 46) & (adx > 21) & (trend_regime >= 3) & (rsi > 54)),
+        # RULE 5: Long Put (any of the three paths)
+        ('LONG_PUT', (iv_rank < 48) & (
+            ((adx > 20) & ((trend_regime <= 1) | (rsi < 42) | (price_vs_sma < -0.025))) |
+            ((adx >= 15) & ((rsi < 38) | (price_vs_sma < -0.035))) |
+            (rsi < 33)
+        )),
+        # RULE 6: Bull Call Spread
+        ('BULL_CALL_SPREAD', (iv_rank >= 56) & (iv_rank <= 63) & (trend_regime >= 3) &
+                             (adx > 26) & (rsi > 62)),
+        # RULE 7: Bear Put Spread
+        ('BEAR_PUT_SPREAD', (iv_rank >= 54) & (iv_rank <= 65) & (trend_regime <= 1) &
+                            (adx > 22) & (rsi < 45)),
+        # RULE 8: Long Straddle
+        ('LONG_STRADDLE', (iv_rank < 35) & (rsi > 45) & (rsi < 58) & (adx < 17)),
+        # RULE 9: Long Strangle
+        ('LONG_STRANGLE', (iv_rank < 36) & (rsi > 44) & (rsi < 59) & (adx < 25)),
+        # RULE 10: Calendar Spread
+        ('CALENDAR_SPREAD', (iv_rank < 42) & (adx < 20) & (rsi > 42) & (rsi < 58) &
+                            (abs_pvs < 0.022)),
+    ]
+    
+    # FINAL FALLBACK: one gather from the bucket table
+    fallback = _FALLBACK_LUT[
+        1 + (iv_rank > 55) - (iv_rank < 35),
+        1 + (rsi >= 50) + (rsi > 58) - (rsi < 42),
+        (adx > 18).astype(np.intp)
+    ]
+    
+    return np.select(
+        [mask for _, mask in rules],
+        [STRATEGY_NAMES.index(strategy) for strategy, _ in rules],
+        default=fallback
+    ).astype(np.int8)
+
+
+# Expected distribution (% of labelled days), parallel to STRATEGY_NAMES
+_MINS = np.array([20, 15, 15, 10, 10, 10, 5, 5, 3, 3], dtype=np.float32)
+_MAXS = np.array([30, 20, 20, 15, 15, 15, 10, 10, 5, 5], dtype=np.float32)
 
 
 def validate_strategy_distribution(training_data):
@@ -198,46 +412,122 @@ def validate_strategy_distribution(training_data):
             - is_valid (bool): True if all validations pass
             - failures (list): List of validation failures
     """
-    strategy_pct = training_data['strategy'].value_counts(normalize=True) * 100
-    
-    expected_ranges = {
-        'IRON_CONDOR': (20, 30),
-        'LONG_CALL': (15, 20),
-        'LONG_PUT': (15, 20),
-        'IRON_BUTTERFLY': (10, 15),
-        'BULL_CALL_SPREAD': (10, 15),
-        'BEAR_PUT_SPREAD': (10, 15),
-        'LONG_STRADDLE': (5, 10),
-        'LONG_STRANGLE': (5, 10),
-        'CALENDAR_SPREAD': (3, 5),
-        'DIAGONAL_SPREAD': (3, 5),
-    }
+    # Percent of labelled days per strategy (int-code bincount, no string hashing)
+    labels = training_data['strategy']
+    codes = pd.Categorical(labels, categories=STRATEGY_NAMES).codes
+    counts = np.bincount(codes[codes >= 0], minlength=len(STRATEGY_NAMES))
+    n_labelled = labels.count()
+    strategy_pct = counts / n_labelled * 100 if n_labelled else np.zeros(len(STRATEGY_NAMES))
     
-    failures = []
-    for strategy, (min_pct, max_pct) in expected_ranges.items():
-        actual_pct = strategy_pct.get(strategy, 0)
-        
-        if actual_pct < min_pct or actual_pct > max_pct:
-            failures.append({
-                'strategy': strategy,
-                'expected': f'{min_pct}-{max_pct}%',
-                'actual': f'{actual_pct:.1f}%',
-                'status': 'FAIL'
-            })
-    
-    # Check all 10 strategies present
-    if len(strategy_pct) < 10:
+    fail_mask = (strategy_pct < _MINS) | (strategy_pct > _MAXS)
+    
+    failures = [
+        {
+            'strategy': STRATEGY_NAMES[i],
+            'expected': f'{_MINS[i]:.0f}-{_MAXS[i]:.0f}%',
+            'actual': f'{strategy_pct[i]:.1f}%',
+            'status': 'FAIL'
+        }
+        for i in np.flatnonzero(fail_mask)
+    ]
+    
+    # Check all 10 strategies present (unknown labels still count as a strategy)
+    n_strategies = np.count_nonzero(counts) + labels[codes < 0].nunique()
+    if n_strategies < 10:
         failures.append({
             'issue': 'Missing strategies',
             'expected': '10 strategies',
-            'actual': f'{len(strategy_pct)} strategies',
-            'missing': list(set(expected_ranges.keys()) - set(strategy_pct.index)),
+            'actual': f'{n_strategies} strategies',
+            'missing': [STRATEGY_NAMES[i] for i in np.flatnonzero(counts == 0)],
             'status': 'FAIL'
         })
     
     return len(failures) == 0, failures
 
 
+# Strategy descriptions for get_strategy_info (built once at import)
+_STRATEGY_INFO = {
+    'IRON_CONDOR': {
+        'description': 'Sell OTM call spread + OTM put spread',
+        'conditions': 'High IV (52-75) + Ranging (ADX < 25) + Neutral RSI (45-55)',
+        'target_pct': '20-30%',
+        'risk_profile': 'Defined risk, neutral',
+        'ideal_market': 'High volatility, sideways movement'
+    },
+    'IRON_BUTTERFLY': {
+        'description': 'Sell ATM call + ATM put, buy OTM wings',
+        'conditions': 'Very High IV (>68) + Very Ranging (ADX < 20)',
+        'target_pct': '10-15%',
+        'risk_profile': 'Defined risk, neutral, tighter profit zone',
+        'ideal_market': 'Very high volatility, very stable price'
+    },
+    'LONG_CALL': {
+        'description': 'Buy OTM call option',
+        'conditions': 'Low IV (<45) + Strong Uptrend (ADX > 22, trend >= 3, RSI > 55)',
+        'target_pct': '15-20%',
+        'risk_profile': 'Limited risk, unlimited upside',
+        'ideal_market': 'Low volatility, strong bullish trend'
+    },
+    'LONG_PUT': {
+        'description': 'Buy OTM put option',
+        'conditions': 'Low IV (<45) + Strong Downtrend OR Bearish Signals',
+        'target_pct': '15-20%',
+        'risk_profile': 'Limited risk, high downside profit',
+        'ideal_market': 'Low volatility, strong bearish trend'
+    },
+    'BULL_CALL_SPREAD': {
+        'description': 'Buy call, sell higher strike call',
+        'conditions': 'Medium-High IV (50-62) + Strong Bullish (trend >= 3, ADX > 24, RSI > 62)',
+        'target_pct': '10-15%',
+        'risk_profile': 'Defined risk, defined profit',
+        'ideal_market': 'Medium volatility, moderate uptrend'
+    },
+    'BEAR_PUT_SPREAD': {
+        'description': 'Buy put, sell lower strike put',
+        'conditions': 'Medium-High IV (50-62) + Strong Bearish (trend <= 1, ADX > 22, RSI < 42)',
+        'target_pct': '10-15%',
+        'risk_profile': 'Defined risk, defined profit',
+        'ideal_market': 'Medium volatility, moderate downtrend'
+    },
+    'LONG_STRADDLE': {
+        'description': 'Buy ATM call + ATM put (same strike)',
+        'conditions': 'Low IV (<35) + Very Neutral (RSI 45-58, ADX < 17)',
+        'target_pct': '5-10%',
+        'risk_profile': 'Limited risk, profit from large move either direction',
+        'ideal_market': 'Low volatility expecting expansion, uncertain direction'
+    },
+    'LONG_STRANGLE': {
+        'description': 'Buy OTM call + OTM put (different strikes)',
+        'conditions': 'Low IV (<35) + Neutral (RSI 45-58, ADX < 24)',
+        'target_pct': '5-10%',
+        'risk_profile': 'Limited risk, cheaper than straddle',
+        'ideal_market': 'Low volatility expecting expansion, uncertain direction'
+    },
+    'CALENDAR_SPREAD': {
+        'description': 'Sell near-term option, buy far-term option (same strike)',
+        'conditions': 'Low IV (<38) + Very Neutral (ADX < 16, RSI 44-56, stable price)',
+        'target_pct': '3-5%',
+        'risk_profile': 'Limited risk, profit from time decay',
+        'ideal_market': 'Low volatility, very stable price'
+    },
+    'DIAGONAL_SPREAD': {
+        'description': 'Sell near-term option, buy far-term option (different strikes)',
+        'conditions': 'Medium IV (45-60) + Slight Bias (0.5-1.2% from SMA, ADX < 15)',
+        'target_pct': '3-5%',
+        'risk_profile': 'Limited risk, combines time decay + directional',
+        'ideal_market': 'Medium volatility, slight directional bias'
+    }
+}
+
+_UNKNOWN_STRATEGY_INFO = {
+    'description': 'Unknown strategy',
+    'conditions': 'N/A',
+    'target_pct': 'N/A',
+    'risk_profile': 'N/A',
+    'ideal_market': 'N/A'
+}
+
+
 def get_strategy_info(strategy_name):
     """
     Get information about a specific strategy
@@ -247,84 +537,6 @@ def get_strategy_info(strategy_name):
     
     Returns:
         dict: Strategy information including description, conditions, target %
+            (shared module constant - treat as read-only)
     """
-    strategy_info = {
-        'IRON_CONDOR': {
-            'description': 'Sell OTM call spread + OTM put spread',
-            'conditions': 'High IV (52-75) + Ranging (ADX < 25) + Neutral RSI (45-55)',
-            'target_pct': '20-30%',
-            'risk_profile': 'Defined risk, neutral',
-            'ideal_market': 'High volatility, sideways movement'
-        },
-        'IRON_BUTTERFLY': {
-            'description': 'Sell ATM call + ATM put, buy OTM wings',
-            'conditions': 'Very High IV (>68) + Very Ranging (ADX < 20)',
-            'target_pct': '10-15%',
-            'risk_profile': 'Defined risk, neutral, tighter profit zone',
-            'ideal_market': 'Very high volatility, very stable price'
-        },
-        'LONG_CALL': {
-            'description': 'Buy OTM call option',
-            'conditions': 'Low IV (<45) + Strong Uptrend (ADX > 22, trend >= 3, RSI > 55)',
-            'target_pct': '15-20%',
-            'risk_profile': 'Limited risk, unlimited upside',
-            'ideal_market': 'Low volatility, strong bullish trend'
-        },
-        'LONG_PUT': {
-            'description': 'Buy OTM put option',
-            'conditions': 'Low IV (<45) + Strong Downtrend OR Bearish Signals',
-            'target_pct': '15-20%',
-            'risk_profile': 'Limited risk, high downside profit',
-            'ideal_market': 'Low volatility, strong bearish trend'
-        },
-        'BULL_CALL_SPREAD': {
-            'description': 'Buy call, sell higher strike call',
-            'conditions': 'Medium-High IV (50-62) + Strong Bullish (trend >= 3, ADX > 24, RSI > 62)',
-            'target_pct': '10-15%',
-            'risk_profile': 'Defined risk, defined profit',
-            'ideal_market': 'Medium volatility, moderate uptrend'
-        },
-        'BEAR_PUT_SPREAD': {
-            'description': 'Buy put, sell lower strike put',
-            'conditions': 'Medium-High IV (50-62) + Strong Bearish (trend <= 1, ADX > 22, RSI < 42)',
-            'target_pct': '10-15%',
-            'risk_profile': 'Defined risk, defined profit',
-            'ideal_market': 'Medium volatility, moderate downtrend'
-        },
-        'LONG_STRADDLE': {
-            'description': 'Buy ATM call + ATM put (same strike)',
-            'conditions': 'Low IV (<35) + Very Neutral (RSI 45-58, ADX < 17)',
-            'target_pct': '5-10%',
-            'risk_profile': 'Limited risk, profit from large move either direction',
-            'ideal_market': 'Low volatility expecting expansion, uncertain direction'
-        },
-        'LONG_STRANGLE': {
-            'description': 'Buy OTM call + OTM put (different strikes)',
-            'conditions': 'Low IV (<35) + Neutral (RSI 45-58, ADX < 24)',
-            'target_pct': '5-10%',
-            'risk_profile': 'Limited risk, cheaper than straddle',
-            'ideal_market': 'Low volatility expecting expansion, uncertain direction'
-        },
-        'CALENDAR_SPREAD': {
-            'description': 'Sell near-term option, buy far-term option (same strike)',
-            'conditions': 'Low IV (<38) + Very Neutral (ADX < 16, RSI 44-56, stable price)',
-            'target_pct': '3-5%',
-            'risk_profile': 'Limited risk, profit from time decay',
-            'ideal_market': 'Low volatility, very stable price'
-        },
-        'DIAGONAL_SPREAD': {
-            'description': 'Sell near-term option, buy far-term option (different strikes)',
-            'conditions': 'Medium IV (45-60) + Slight Bias (0.5-1.2% from SMA, ADX < 15)',
-            'target_pct': '3-5%',
-            'risk_profile': 'Limited risk, combines time decay + directional',
-            'ideal_market': 'Medium volatility, slight directional bias'
-        }
-    }
-    
-    return strategy_info.get(strategy_name, {
-        'description': 'Unknown strategy',
-        'conditions': 'N/A',
-        'target_pct': 'N/A',
-        'risk_profile': 'N/A',
-        'ideal_market': 'N/A'
-    })
+    return _STRATEGY_INFO.get(strategy_name, _UNKNOWN_STRATEGY_INFO)
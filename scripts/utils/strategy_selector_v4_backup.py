@@ -11,58 +11,117 @@ validation feedback. See .kiro/steering/strategy-selection-rules.md for
 detailed documentation.
 """
 
+from collections import namedtuple
+from types import MappingProxyType
 
-def select_strategy_from_features(features):
+import numpy as np
+import pandas as pd
+
+import os
+import sys
+
+if not __package__:
+    # Run directly as a script: make the repo root importable for scripts.utils
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.utils._kernels import njit, prange, NUMBA_AVAILABLE
+
+
+# All strategies the rules can return, in strategy-ID order
+STRATEGY_NAMES = (
+    'IRON_CONDOR',
+    'LONG_CALL',
+    'LONG_PUT',
+    'IRON_BUTTERFLY',
+    'BULL_CALL_SPREAD',
+    'BEAR_PUT_SPREAD',
+    'LONG_STRADDLE',
+    'LONG_STRANGLE',
+    'CALENDAR_SPREAD',
+    'DIAGONAL_SPREAD',
+)
+
+# Strategy IDs (indices into STRATEGY_NAMES) returned by the compiled rules
+(_IRON_CONDOR, _LONG_CALL, _LONG_PUT, _IRON_BUTTERFLY, _BULL_CALL_SPREAD, _BEAR_PUT_SPREAD,
+ _LONG_STRADDLE, _LONG_STRANGLE, _CALENDAR_SPREAD, _DIAGONAL_SPREAD) = range(len(STRATEGY_NAMES))
+
+# Features read by the rules, with the defaults used when one is missing
+# (volatility_regime is read by the per-row function but no rule uses it)
+_FEATURE_DEFAULTS = (
+    ('iv_rank', 50),
+    ('adx_14', 20),
+    ('trend_regime', 2),
+    ('rsi_14', 50),
+    ('price_vs_sma_20', 0),
+)
+
+# Fixed-schema feature record (e.g. from df.itertuples(index=False, name='FeatureRow'))
+FeatureRow = namedtuple('FeatureRow', [column for column, _ in _FEATURE_DEFAULTS])
+
+
+def _fallback_strategy(iv_rank, rsi):
     """
-    CORRECTED rule-based strategy selection based on validation feedback
+    FINAL FALLBACK of the rules, for days that don't match any specific rule
     
-    Key fixes from validation report:
-    - Broadened Iron Condor conditions (50-75 IV, ADX < 25)
-    - Relaxed Long Call/Put thresholds (IV < 40, ADX > 25)
-    - Tightened Bull/Bear Spread conditions (40-65 IV, stronger trend)
-    - Fixed volatility plays (buy in LOW IV, not high)
-    - Made Diagonal Spread much more restrictive
-    - Proper priority ordering to prevent overmatching
-    
-    Args:
-        features (dict): Dictionary containing market features:
-            - iv_rank: Implied Volatility Rank (0-100) [corrected in feature engineering]
-            - adx_14: Average Directional Index (0-100)
-            - trend_regime: Trend classification (0-4)
-            - rsi_14: Relative Strength Index (0-100)
-            - price_vs_sma_20: Price relative to 20-day SMA (-0.20 to +0.20)
-            - volatility_regime: Volatility classification (0-4)
+    Reference implementation used to build _FALLBACK_LUT at import.
     
     Returns:
-        str: Strategy name (one of 10 strategies)
+        int: Strategy ID
+    """
+    # If we still haven't matched, use the most common strategy for the IV regime
+    # This is better than skipping, as it's based on volatility regime
     
-    Target distribution:
-        - IRON_CONDOR: 20-30% (High IV + Ranging)
-        - LONG_CALL: 15-20% (Low IV + Strong Uptrend)
-        - LONG_PUT: 15-20% (Low IV + Strong Downtrend)
-        - IRON_BUTTERFLY: 10-15% (Very High IV + Ranging)
-        - BULL_CALL_SPREAD: 10-15% (Medium IV + Moderate Bullish)
-        - BEAR_PUT_SPREAD: 10-15% (Medium IV + Moderate Bearish)
-        - LONG_STRADDLE: 5-10% (Low IV + Neutral, expecting expansion)
-        - LONG_STRANGLE: 5-10% (Low IV + Neutral, expecting expansion)
-        - CALENDAR_SPREAD: 3-5% (Low IV + Very Neutral)
-        - DIAGONAL_SPREAD: 3-5% (Medium IV + Slight bias)
+    if iv_rank > 55:
+        # High IV = sell premium
+        return _IRON_CONDOR
+    elif iv_rank < 35:
+        # Low IV = buy options
+        if rsi >= 50:
+            return _LONG_CALL
+        else:
+            return _LONG_PUT
+    else:
+        # Medium IV = spreads
+        if rsi >= 50:
+            return _BULL_CALL_SPREAD
+        else:
+            return _BEAR_PUT_SPREAD
+
+
+# Fallback strategy ID per bucket, evaluated once at a representative point:
+#   iv_rank: 0 (<35), 1 (35-55, or NaN), 2 (>55)
+#   rsi:     0 (<50, or NaN), 1 (>=50)
+_FALLBACK_LUT = np.array([
+    [_fallback_strategy(iv_rank, rsi) for rsi in (40, 60)]
+    for iv_rank in (20, 45, 60)
+], dtype=np.int8)
+
+
+@njit('int8(float64, float64, float64, float64, float64)', cache=True, fastmath=False)
+def _select_strategy_nb(iv_rank, adx, trend_regime, rsi, price_vs_sma):
     """
-    # Use iv_rank (now corrected in feature engineering)
-    iv_rank = features.get('iv_rank', 50)
-    adx = features.get('adx_14', 20)
-    trend_regime = features.get('trend_regime', 2)
-    rsi = features.get('rsi_14', 50)
-    price_vs_sma = features.get('price_vs_sma_20', 0)
-    volatility_regime = features.get('volatility_regime', 1)
+    Compiled rules cascade (see select_strategy_from_features)
+    
+    fastmath stays off: the thresholds are exact and NaN features must
+    compare False, as in plain Python. The explicit signature compiles (or
+    loads from the disk cache) at import instead of on the first call;
+    trend_regime is float64 so a NaN regime still fails every comparison.
+    
+    Returns:
+        int: Strategy ID (index into STRATEGY_NAMES)
+    """
+    # Sub-expressions shared by several rule blocks
+    abs_pvs = abs(price_vs_sma)
+    trend_ge3 = trend_regime >= 3
+    trend_le1 = trend_regime <= 1
     
     # ========================================================================
     # PRIORITY 1: Check Diagonal Spread FIRST (most specific, rare)
     # ========================================================================
     # FIXED: Must check before IC to prevent IC from stealing these days
     # Diagonal needs very specific conditions: medium IV + slight bias + low ADX
-    if 45 < iv_rank < 60 and trend_regime == 2 and 0.005 < abs(price_vs_sma) < 0.015 and adx < 15:
-        return 'DIAGONAL_SPREAD'
+    if 45 < iv_rank < 60 and trend_regime == 2 and 0.005 < abs_pvs < 0.015 and adx < 15:
+        return _DIAGONAL_SPREAD
     
     # ========================================================================
     # PRIORITY 2: High IV + Ranging = Premium Selling (MOST COMMON)
@@ -70,12 +129,12 @@ def select_strategy_from_features(features):
     # FIXED v2: Removed RSI requirement - was too restrictive (10.1% vs 20-30%)
     # Iron Condor should be default for high IV ranging markets
     if 50 < iv_rank < 75 and adx < 25:
-        return 'IRON_CONDOR'
+        return _IRON_CONDOR
     
     # Very high IV + ranging = Iron Butterfly
     # FIXED: Lowered from >75 to >70
     if iv_rank > 70 and adx < 20:
-        return 'IRON_BUTTERFLY'
+        return _IRON_BUTTERFLY
     
     # ========================================================================
     # PRIORITY 2: Low IV + Strong Trend = Long Options (SECOND MOST COMMON)
@@ -84,15 +143,15 @@ def select_strategy_from_features(features):
     # FIXED v3: Relaxed Long Put (was 5.1%, target 15-20%)
     if iv_rank < 42 and adx > 23:
         # Strong uptrend = Long Call
-        if trend_regime >= 3 and rsi > 55:
-            return 'LONG_CALL'
+        if trend_ge3 and rsi > 55:
+            return _LONG_CALL
         # Strong downtrend = Long Put
         # FIXED: Relaxed IV (<42), ADX (>23), easier RSI/price conditions
-        elif trend_regime <= 1 or (price_vs_sma < -0.025 and rsi < 45):
-            return 'LONG_PUT'
+        elif trend_le1 or (price_vs_sma < -0.025 and rsi < 45):
+            return _LONG_PUT
         # NEW: Catch strong selloffs
         elif rsi < 33 or price_vs_sma < -0.04:
-            return 'LONG_PUT'
+            return _LONG_PUT
     
     # ========================================================================
     # PRIORITY 3: Medium IV + Moderate Trend = Spreads
@@ -102,11 +161,11 @@ def select_strategy_from_features(features):
     if 45 <= iv_rank <= 60:
         # Moderate bullish = Bull Call Spread
         # FIXED: Narrower IV (45-60), higher ADX (22), added RSI check (>58)
-        if trend_regime >= 3 and adx > 22 and rsi > 58:
-            return 'BULL_CALL_SPREAD'
+        if trend_ge3 and adx > 22 and rsi > 58:
+            return _BULL_CALL_SPREAD
         # Moderate bearish = Bear Put Spread
-        elif trend_regime <= 1 and adx > 20:
-            return 'BEAR_PUT_SPREAD'
+        elif trend_le1 and adx > 20:
+            return _BEAR_PUT_SPREAD
     
     # ========================================================================
     # PRIORITY 4: Low IV + Neutral = Volatility Expansion Plays
@@ -115,10 +174,10 @@ def select_strategy_from_features(features):
     if iv_rank < 35 and 45 < rsi < 58:  # Was < 30 and 45 < rsi < 55
         # Very neutral + ranging = Straddle
         if adx < 17:  # Was < 15
-            return 'LONG_STRADDLE'
+            return _LONG_STRADDLE
         # Slightly less neutral = Strangle (cheaper)
         elif adx < 22:  # Was < 20
-            return 'LONG_STRANGLE'
+            return _LONG_STRANGLE
     
     # ========================================================================
     # PRIORITY 5: Low IV + Very Neutral = Time Decay Plays
@@ -127,8 +186,10 @@ def select_strategy_from_features(features):
     # FIXED v2: Even more restrictive - Calendar should be RARE (3-5%)
     # FIXED v3: Slightly relaxed (was 0.8%, target 3-5%)
     # Require: Low IV + Very low ADX + Very neutral RSI + Very stable price
-    if iv_rank < 33 and adx < 14 and 46 < rsi < 54 and abs(price_vs_sma) < 0.012:
-        return 'CALENDAR_SPREAD'
+    # (iv_rank < 33, ADX < 14, RSI 46-54, |price_vs_sma| < 1.2%)
+    # REMOVED: every such day is already a LONG_STRADDLE at Priority 4
+    # (IV < 35, RSI 45-58, ADX < 17), so this check could never fire.
+    # Calendar days come from the BROADER rule below.
     
     # Diagonal Spread already checked at Priority 1 (before IC)
     
@@ -139,63 +200,281 @@ def select_strategy_from_features(features):
     # They handle the "medium everything" days that are common in real markets
     
     # NEW v4: Catch bearish Long Put before IC steals them
-    if iv_rank < 50 and (trend_regime <= 1 or rsi < 40 or price_vs_sma < -0.03):
+    if iv_rank < 50 and (trend_le1 or rsi < 40 or price_vs_sma < -0.03):
         if adx > 18:
-            return 'LONG_PUT'
+            return _LONG_PUT
     
     # Medium-High IV + Ranging = Iron Condor (most common neutral strategy)
     # FIXED v4: Raised threshold from 45 to 50 to prevent stealing Long Put days
     if iv_rank > 50 and adx < 25:
-        return 'IRON_CONDOR'
+        return _IRON_CONDOR
     
     # Medium IV + Moderate Trend = Spreads
     # FIXED v4: Further tightened Bull Call BROADER rule to align with PRIORITY rule
     if 40 <= iv_rank <= 65:  # Was 35-70 (too broad)
         if adx > 20:  # Was 18 (too low)
-            if rsi > 60 and trend_regime >= 3:  # Was 55 (too easy)
-                return 'BULL_CALL_SPREAD'
+            if rsi > 60 and trend_ge3:  # Was 55 (too easy)
+                return _BULL_CALL_SPREAD
             elif rsi < 45:  # Was 48
-                return 'BEAR_PUT_SPREAD'
+                return _BEAR_PUT_SPREAD
     
     # Low-Medium IV + Weak Trend = Long Options (less strict)
     # FIXED v3: Easier for Long Put to trigger
     if iv_rank < 45:
         if adx > 20:
             if rsi > 52:
-                return 'LONG_CALL'
+                return _LONG_CALL
             elif rsi < 50:  # Easier threshold for Long Put
-                return 'LONG_PUT'
+                return _LONG_PUT
     
     # Very Neutral + Medium IV = Calendar or Diagonal
     # FIXED v4: Reversed logic - stable price = Calendar, slight bias = Diagonal
     if 40 < iv_rank < 60 and adx < 18 and 46 < rsi < 54:
-        if abs(price_vs_sma) < 0.008:  # Very stable (< 0.8% from SMA) = Calendar
-            return 'CALENDAR_SPREAD'
-        elif 0.005 < abs(price_vs_sma) < 0.015:  # Slight bias (0.5-1.5%) = Diagonal
-            return 'DIAGONAL_SPREAD'
+        if abs_pvs < 0.008:  # Very stable (< 0.8% from SMA) = Calendar
+            return _CALENDAR_SPREAD
+        elif 0.005 < abs_pvs < 0.015:  # Slight bias (0.5-1.5%) = Diagonal
+            return _DIAGONAL_SPREAD
         # If > 1.5% from SMA, fall through to other strategies
     
     # ========================================================================
     # FINAL FALLBACK: Only for truly ambiguous days
     # ========================================================================
-    # If we still haven't matched, use the most common strategy for the IV regime
-    # This is better than skipping, as it's based on volatility regime
+    # Branchless: table lookup on the (IV, RSI) buckets (see _fallback_strategy)
+    iv_bucket = 1 + (iv_rank > 55) - (iv_rank < 35)
+    rsi_bucket = 1 * (rsi >= 50)
+    return _FALLBACK_LUT[iv_bucket, rsi_bucket]
+
+
+@njit(cache=True, parallel=True)
+def _select_many(iv_rank, adx, trend_regime, rsi, price_vs_sma, out):
+    """Apply _select_strategy_nb to every row, writing int8 strategy IDs into out"""
+    for i in prange(out.shape[0]):
+        out[i] = _select_strategy_nb(iv_rank[i], adx[i], trend_regime[i], rsi[i], price_vs_sma[i])
+
+
+def select_strategy_from_features(features):
+    """
+    CORRECTED rule-based strategy selection based on validation feedback
     
-    if iv_rank > 55:
-        # High IV = sell premium
-        return 'IRON_CONDOR'
-    elif iv_rank < 35:
-        # Low IV = buy options
-        if rsi >= 50:
-            return 'LONG_CALL'
-        else:
-            return 'LONG_PUT'
-    else:
-        # Medium IV = spreads
-        if rsi >= 50:
-            return 'BULL_CALL_SPREAD'
-        else:
-            return 'BEAR_PUT_SPREAD'
+    Key fixes from validation report:
+    - Broadened Iron Condor conditions (50-75 IV, ADX < 25)
+    - Relaxed Long Call/Put thresholds (IV < 40, ADX > 25)
+    - Tightened Bull/Bear Spread conditions (40-65 IV, stronger trend)
+    - Fixed volatility plays (buy in LOW IV, not high)
+    - Made Diagonal Spread much more restrictive
+    - Proper priority ordering to prevent overmatching
+    
+    Args:
+        features (dict or FeatureRow): Dictionary containing market features
+            (or a FeatureRow of the five the rules read):
+            - iv_rank: Implied Volatility Rank (0-100) [corrected in feature engineering]
+            - adx_14: Average Directional Index (0-100)
+            - trend_regime: Trend classification (0-4)
+            - rsi_14: Relative Strength Index (0-100)
+            - price_vs_sma_20: Price relative to 20-day SMA (-0.20 to +0.20)
+            - volatility_regime: Volatility classification (0-4)
+    
+    Returns:
+        str: Strategy name (one of 10 strategies)
+    
+    Target distribution:
+        - IRON_CONDOR: 20-30% (High IV + Ranging)
+        - LONG_CALL: 15-20% (Low IV + Strong Uptrend)
+        - LONG_PUT: 15-20% (Low IV + Strong Downtrend)
+        - IRON_BUTTERFLY: 10-15% (Very High IV + Ranging)
+        - BULL_CALL_SPREAD: 10-15% (Medium IV + Moderate Bullish)
+        - BEAR_PUT_SPREAD: 10-15% (Medium IV + Moderate Bearish)
+        - LONG_STRADDLE: 5-10% (Low IV + Neutral, expecting expansion)
+        - LONG_STRANGLE: 5-10% (Low IV + Neutral, expecting expansion)
+        - CALENDAR_SPREAD: 3-5% (Low IV + Very Neutral)
+        - DIAGONAL_SPREAD: 3-5% (Medium IV + Slight bias)
+    """
+    return STRATEGY_NAMES[select_strategy_id(features)]
+
+
+def select_strategy_id(features):
+    """
+    Integer-coded select_strategy_from_features (no string at all)
+    
+    Args:
+        features (dict or tuple): Same features and defaults as
+            select_strategy_from_features; a FeatureRow (or any namedtuple
+            with its fields) skips the dict lookups, and a plain tuple is
+            read positionally in FeatureRow field order
+    
+    Returns:
+        int: Strategy ID (index into STRATEGY_NAMES)
+    """
+    # Use iv_rank (now corrected in feature engineering)
+    # (volatility_regime is part of the feature set but no rule reads it)
+    if isinstance(features, tuple):
+        if not hasattr(features, '_fields'):
+            features = FeatureRow._make(features)
+        return int(_select_strategy_nb(float(features.iv_rank), float(features.adx_14),
+                                       float(features.trend_regime), float(features.rsi_14),
+                                       float(features.price_vs_sma_20)))
+    
+    return int(_select_strategy_nb(
+        float(features.get('iv_rank', 50)),
+        float(features.get('adx_14', 20)),
+        float(features.get('trend_regime', 2)),
+        float(features.get('rsi_14', 50)),
+        float(features.get('price_vs_sma_20', 0))
+    ))
+
+
+def select_strategy_positional(iv_rank, adx_14, trend_regime, rsi_14, price_vs_sma_20):
+    """
+    select_strategy_from_features for features passed as plain numbers
+    
+    For row-at-a-time callers that already hold the values (no dict to
+    build or probe).
+    
+    Args:
+        iv_rank (float): Implied Volatility Rank (0-100)
+        adx_14 (float): Average Directional Index (0-100)
+        trend_regime (int): Trend classification (0-4)
+        rsi_14 (float): Relative Strength Index (0-100)
+        price_vs_sma_20 (float): Price relative to 20-day SMA
+    
+    Returns:
+        str: Strategy name
+    """
+    strategy_id = int(_select_strategy_nb(float(iv_rank), float(adx_14), float(trend_regime),
+                                          float(rsi_14), float(price_vs_sma_20)))
+    
+    return STRATEGY_NAMES[strategy_id]
+
+
+def _feature_array(features_df, column, default):
+    """Feature column as float64 (filled with the default if missing)"""
+    if column in features_df.columns:
+        return features_df[column].to_numpy(dtype=np.float64)
+    return np.full(len(features_df), default, dtype=np.float64)
+
+
+def select_strategy_batch(features_df):
+    """
+    Vectorized select_strategy_from_features for a whole features DataFrame
+    
+    Args:
+        features_df (pd.DataFrame): One row per day with the feature columns
+            (missing columns use the same defaults as the per-row function)
+    
+    Returns:
+        pd.Series: Categorical strategy names aligned with features_df.index
+    """
+    codes = select_strategy_array(*(
+        _feature_array(features_df, column, default) for column, default in _FEATURE_DEFAULTS
+    ))
+    
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=STRATEGY_NAMES),
+        index=features_df.index,
+        name='strategy'
+    )
+
+
+def select_strategy_array(iv_rank, adx, trend_regime, rsi, price_vs_sma):
+    """
+    Strategy IDs for feature arrays (streaming / array-based inference)
+    
+    Runs the compiled cascade over all rows (in parallel) when Numba is
+    installed, otherwise evaluates each rule once as a boolean mask over the
+    feature arrays. Either way the first matching rule wins per row.
+    
+    Args:
+        iv_rank, adx, trend_regime, rsi, price_vs_sma: 1-D arrays of equal length
+            (converted to contiguous float64)
+    
+    Returns:
+        np.ndarray: int8 strategy IDs (indices into STRATEGY_NAMES)
+    """
+    iv_rank, adx, trend_regime, rsi, price_vs_sma = (
+        np.ascontiguousarray(x, dtype=np.float64) for x in (iv_rank, adx, trend_regime, rsi, price_vs_sma)
+    )
+    
+    # The compiled loop does no bounds checks, so lengths must agree up front
+    shapes = {x.shape for x in (iv_rank, adx, trend_regime, rsi, price_vs_sma)}
+    if len(shapes) > 1 or iv_rank.ndim != 1:
+        raise ValueError(f"Feature arrays must be 1-D and of equal length, got shapes {sorted(shapes)}")
+    
+    if NUMBA_AVAILABLE:
+        # Compiled cascade, rows in parallel
+        codes = np.empty(len(iv_rank), dtype=np.int8)
+        _select_many(iv_rank, adx, trend_regime, rsi, price_vs_sma, codes)
+        return codes
+    
+    return _select_masked(iv_rank, adx, trend_regime, rsi, price_vs_sma)
+
+
+def _select_masked(iv_rank, adx, trend_regime, rsi, price_vs_sma):
+    """
+    NumPy version of the rules cascade: one boolean mask per rule
+    
+    Returns:
+        np.ndarray: Strategy IDs (first matching rule per row)
+    """
+    abs_pvs = np.abs(price_vs_sma)
+    trend_ge3 = trend_regime >= 3
+    trend_le1 = trend_regime <= 1
+    
+    # Shared rule guards
+    low_iv_trending = (iv_rank < 42) & (adx > 23)
+    medium_iv = (iv_rank >= 45) & (iv_rank <= 60)
+    low_iv_neutral = (iv_rank < 35) & (rsi > 45) & (rsi < 58)
+    broad_spreads = (iv_rank >= 40) & (iv_rank <= 65) & (adx > 20)
+    broad_longs = (iv_rank < 45) & (adx > 20)
+    broad_neutral = (iv_rank > 40) & (iv_rank < 60) & (adx < 18) & (rsi > 46) & (rsi < 54)
+    
+    # (strategy, mask) in rule priority order
+    rules = [
+        # PRIORITY 1: Diagonal Spread
+        ('DIAGONAL_SPREAD', (iv_rank > 45) & (iv_rank < 60) & (trend_regime == 2) &
+                            (abs_pvs > 0.005) & (abs_pvs < 0.015) & (adx < 15)),
+        # PRIORITY 2: Premium selling
+        ('IRON_CONDOR', (iv_rank > 50) & (iv_rank < 75) & (adx < 25)),
+        ('IRON_BUTTERFLY', (iv_rank > 70) & (adx < 20)),
+        # PRIORITY 2: Long options
+        ('LONG_CALL', low_iv_trending & trend_ge3 & (rsi > 55)),
+        ('LONG_PUT', low_iv_trending & (
+            trend_le1 | ((price_vs_sma < -0.025) & (rsi < 45)) |
+            (rsi < 33) | (price_vs_sma < -0.04)
+        )),
+        # PRIORITY 3: Spreads
+        ('BULL_CALL_SPREAD', medium_iv & trend_ge3 & (adx > 22) & (rsi > 58)),
+        ('BEAR_PUT_SPREAD', medium_iv & trend_le1 & (adx > 20)),
+        # PRIORITY 4: Volatility expansion
+        ('LONG_STRADDLE', low_iv_neutral & (adx < 17)),
+        ('LONG_STRANGLE', low_iv_neutral & (adx < 22)),
+        # BROADER RULES
+        ('LONG_PUT', (iv_rank < 50) & (adx > 18) &
+                     (trend_le1 | (rsi < 40) | (price_vs_sma < -0.03))),
+        ('IRON_CONDOR', (iv_rank > 50) & (adx < 25)),
+        ('BULL_CALL_SPREAD', broad_spreads & (rsi > 60) & trend_ge3),
+        ('BEAR_PUT_SPREAD', broad_spreads & (rsi < 45)),
+        ('LONG_CALL', broad_longs & (rsi > 52)),
+        ('LONG_PUT', broad_longs & (rsi < 50)),
+        ('CALENDAR_SPREAD', broad_neutral & (abs_pvs < 0.008)),
+        ('DIAGONAL_SPREAD', broad_neutral & (abs_pvs > 0.005) & (abs_pvs < 0.015)),
+    ]
+    
+    # FINAL FALLBACK: one gather from the bucket table
+    fallback = _FALLBACK_LUT[
+        1 + (iv_rank > 55) - (iv_rank < 35),
+        (rsi >= 50).astype(np.intp)
+    ]
+    
+    return np.select(
+        [mask for _, mask in rules],
+        [STRATEGY_NAMES.index(strategy) for strategy, _ in rules],
+        default=fallback
+    ).astype(np.int8)
+
+
+# Expected distribution (% of labelled days), parallel to STRATEGY_NAMES
+_MINS = np.array([20, 15, 15, 10, 10, 10, 5, 5, 3, 3], dtype=np.float32)
+_MAXS = np.array([30, 20, 20, 15, 15, 15, 10, 10, 5, 5], dtype=np.float32)
 
 
 def validate_strategy_distribution(training_data):
@@ -210,46 +489,123 @@ def validate_strategy_distribution(training_data):
             - is_valid (bool): True if all validations pass
             - failures (list): List of validation failures
     """
-    strategy_pct = training_data['strategy'].value_counts(normalize=True) * 100
-    
-    expected_ranges = {
-        'IRON_CONDOR': (20, 30),
-        'LONG_CALL': (15, 20),
-        'LONG_PUT': (15, 20),
-        'IRON_BUTTERFLY': (10, 15),
-        'BULL_CALL_SPREAD': (10, 15),
-        'BEAR_PUT_SPREAD': (10, 15),
-        'LONG_STRADDLE': (5, 10),
-        'LONG_STRANGLE': (5, 10),
-        'CALENDAR_SPREAD': (3, 5),
-        'DIAGONAL_SPREAD': (3, 5),
-    }
-    
-    failures = []
-    for strategy, (min_pct, max_pct) in expected_ranges.items():
-        actual_pct = strategy_pct.get(strategy, 0)
-        
-        if actual_pct < min_pct or actual_pct > max_pct:
-            failures.append({
-                'strategy': strategy,
-                'expected': f'{min_pct}-{max_pct}%',
-                'actual': f'{actual_pct:.1f}%',
-                'status': 'FAIL'
-            })
-    
-    # Check all 10 strategies present
-    if len(strategy_pct) < 10:
+    # Percent of labelled days per strategy (int-code bincount, no string hashing)
+    labels = training_data['strategy']
+    codes = pd.Categorical(labels, categories=STRATEGY_NAMES).codes
+    counts = np.bincount(codes[codes >= 0], minlength=len(STRATEGY_NAMES))
+    n_labelled = labels.count()
+    strategy_pct = counts / n_labelled * 100 if n_labelled else np.zeros(len(STRATEGY_NAMES))
+    
+    fail_mask = (strategy_pct < _MINS) | (strategy_pct > _MAXS)
+    
+    failures = [
+        {
+            'strategy': STRATEGY_NAMES[i],
+            'expected': f'{_MINS[i]:.0f}-{_MAXS[i]:.0f}%',
+            'actual': f'{strategy_pct[i]:.1f}%',
+            'status': 'FAIL'
+        }
+        for i in np.flatnonzero(fail_mask)
+    ]
+    
+    # Check all 10 strategies present (unknown labels still count as a strategy)
+    n_strategies = np.count_nonzero(counts) + labels[codes < 0].nunique()
+    if n_strategies < 10:
         failures.append({
             'issue': 'Missing strategies',
             'expected': '10 strategies',
-            'actual': f'{len(strategy_pct)} strategies',
-            'missing': list(set(expected_ranges.keys()) - set(strategy_pct.index)),
+            'actual': f'{n_strategies} strategies',
+            'missing': [STRATEGY_NAMES[i] for i in np.flatnonzero(counts == 0)],
             'status': 'FAIL'
         })
     
     return len(failures) == 0, failures
 
 
+# Strategy descriptions for get_strategy_info (built once at import, read-only)
+_STRATEGY_INFO = {
+    'IRON_CONDOR': MappingProxyType({
+        'description': 'Sell OTM call spread + OTM put spread',
+        'conditions': 'High IV (50-75) + Ranging (ADX < 25) + Neutral RSI',
+        'target_pct': '20-30%',
+        'risk_profile': 'Defined risk, neutral',
+        'ideal_market': 'High volatility, sideways movement'
+    }),
+    'IRON_BUTTERFLY': MappingProxyType({
+        'description': 'Sell ATM call + ATM put, buy OTM wings',
+        'conditions': 'Very High IV (>70) + Very Ranging (ADX < 20)',
+        'target_pct': '10-15%',
+        'risk_profile': 'Defined risk, neutral, tighter profit zone',
+        'ideal_market': 'Very high volatility, very stable price'
+    }),
+    'LONG_CALL': MappingProxyType({
+        'description': 'Buy OTM call option',
+        'conditions': 'Low IV (<40) + Strong Uptrend (ADX > 25, trend >= 3)',
+        'target_pct': '15-20%',
+        'risk_profile': 'Limited risk, unlimited upside',
+        'ideal_market': 'Low volatility, strong bullish trend'
+    }),
+    'LONG_PUT': MappingProxyType({
+        'description': 'Buy OTM put option',
+        'conditions': 'Low IV (<40) + Strong Downtrend (ADX > 25, trend <= 1)',
+        'target_pct': '15-20%',
+        'risk_profile': 'Limited risk, high downside profit',
+        'ideal_market': 'Low volatility, strong bearish trend'
+    }),
+    'BULL_CALL_SPREAD': MappingProxyType({
+        'description': 'Buy call, sell higher strike call',
+        'conditions': 'Medium IV (40-65) + Moderate Bullish (trend >= 3, ADX > 20)',
+        'target_pct': '10-15%',
+        'risk_profile': 'Defined risk, defined profit',
+        'ideal_market': 'Medium volatility, moderate uptrend'
+    }),
+    'BEAR_PUT_SPREAD': MappingProxyType({
+        'description': 'Buy put, sell lower strike put',
+        'conditions': 'Medium IV (40-65) + Moderate Bearish (trend <= 1, ADX > 20)',
+        'target_pct': '10-15%',
+        'risk_profile': 'Defined risk, defined profit',
+        'ideal_market': 'Medium volatility, moderate downtrend'
+    }),
+    'LONG_STRADDLE': MappingProxyType({
+        'description': 'Buy ATM call + ATM put (same strike)',
+        'conditions': 'Low IV (<30) + Very Neutral (RSI 45-55, ADX < 15)',
+        'target_pct': '5-10%',
+        'risk_profile': 'Limited risk, profit from large move either direction',
+        'ideal_market': 'Low volatility expecting expansion, uncertain direction'
+    }),
+    'LONG_STRANGLE': MappingProxyType({
+        'description': 'Buy OTM call + OTM put (different strikes)',
+        'conditions': 'Low IV (<30) + Neutral (RSI 45-55, ADX < 20)',
+        'target_pct': '5-10%',
+        'risk_profile': 'Limited risk, cheaper than straddle',
+        'ideal_market': 'Low volatility expecting expansion, uncertain direction'
+    }),
+    'CALENDAR_SPREAD': MappingProxyType({
+        'description': 'Sell near-term option, buy far-term option (same strike)',
+        'conditions': 'Low IV (<35) + Very Neutral (ADX < 15, RSI 45-55, stable price)',
+        'target_pct': '3-5%',
+        'risk_profile': 'Limited risk, profit from time decay',
+        'ideal_market': 'Low volatility, very stable price'
+    }),
+    'DIAGONAL_SPREAD': MappingProxyType({
+        'description': 'Sell near-term option, buy far-term option (different strikes)',
+        'conditions': 'Medium IV (45-60) + Slight Bias (0.5-1.5% from SMA, ADX < 15)',
+        'target_pct': '3-5%',
+        'risk_profile': 'Limited risk, combines time decay + directional',
+        'ideal_market': 'Medium volatility, slight directional bias'
+    })
+}
+
+
+_UNKNOWN_STRATEGY_INFO = MappingProxyType({
+    'description': 'Unknown strategy',
+    'conditions': 'N/A',
+    'target_pct': 'N/A',
+    'risk_profile': 'N/A',
+    'ideal_market': 'N/A'
+})
+
+
 def get_strategy_info(strategy_name):
     """
     Get information about a specific strategy
@@ -258,85 +614,7 @@ def get_strategy_info(strategy_name):
         strategy_name (str): Name of the strategy
     
     Returns:
-        dict: Strategy information including description, conditions, target %
+        Mapping: Read-only strategy information including description,
+            conditions, target % (shared, not copied per call)
     """
-    strategy_info = {
-        'IRON_CONDOR': {
-            'description': 'Sell OTM call spread + OTM put spread',
-            'conditions': 'High IV (50-75) + Ranging (ADX < 25) + Neutral RSI',
-            'target_pct': '20-30%',
-            'risk_profile': 'Defined risk, neutral',
-            'ideal_market': 'High volatility, sideways movement'
-        },
-        'IRON_BUTTERFLY': {
-            'description': 'Sell ATM call + ATM put, buy OTM wings',
-            'conditions': 'Very High IV (>70) + Very Ranging (ADX < 20)',
-            'target_pct': '10-15%',
-            'risk_profile': 'Defined risk, neutral, tighter profit zone',
-            'ideal_market': 'Very high volatility, very stable price'
-        },
-        'LONG_CALL': {
-            'description': 'Buy OTM call option',
-            'conditions': 'Low IV (<40) + Strong Uptrend (ADX > 25, trend >= 3)',
-            'target_pct': '15-20%',
-            'risk_profile': 'Limited risk, unlimited upside',
-            'ideal_market': 'Low volatility, strong bullish trend'
-        },
-        'LONG_PUT': {
-            'description': 'Buy OTM put option',
-            'conditions': 'Low IV (<40) + Strong Downtrend (ADX > 25, trend <= 1)',
-            'target_pct': '15-20%',
-            'risk_profile': 'Limited risk, high downside profit',
-            'ideal_market': 'Low volatility, strong bearish trend'
-        },
-        'BULL_CALL_SPREAD': {
-            'description': 'Buy call, sell higher strike call',
-            'conditions': 'Medium IV (40-65) + Moderate Bullish (trend >= 3, ADX > 20)',
-            'target_pct': '10-15%',
-            'risk_profile': 'Defined risk, defined profit',
-            'ideal_market': 'Medium volatility, moderate uptrend'
-        },
-        'BEAR_PUT_SPREAD': {
-            'description': 'Buy put, sell lower strike put',
-            'conditions': 'Medium IV (40-65) + Moderate Bearish (trend <= 1, ADX > 20)',
-            'target_pct': '10-15%',
-            'risk_profile': 'Defined risk, defined profit',
-            'ideal_market': 'Medium volatility, moderate downtrend'
-        },
-        'LONG_STRADDLE': {
-            'description': 'Buy ATM call + ATM put (same strike)',
-            'conditions': 'Low IV (<30) + Very Neutral (RSI 45-55, ADX < 15)',
-            'target_pct': '5-10%',
-            'risk_profile': 'Limited risk, profit from large move either direction',
-            'ideal_market': 'Low volatility expecting expansion, uncertain direction'
-        },
-        'LONG_STRANGLE': {
-            'description': 'Buy OTM call + OTM put (different strikes)',
-            'conditions': 'Low IV (<30) + Neutral (RSI 45-55, ADX < 20)',
-            'target_pct': '5-10%',
-            'risk_profile': 'Limited risk, cheaper than straddle',
-            'ideal_market': 'Low volatility expecting expansion, uncertain direction'
-        },
-        'CALENDAR_SPREAD': {
-            'description': 'Sell near-term option, buy far-term option (same strike)',
-            'conditions': 'Low IV (<35) + Very Neutral (ADX < 15, RSI 45-55, stable price)',
-            'target_pct': '3-5%',
-            'risk_profile': 'Limited risk, profit from time decay',
-            'ideal_market': 'Low volatility, very stable price'
-        },
-        'DIAGONAL_SPREAD': {
-            'description': 'Sell near-term option, buy far-term option (different strikes)',
-            'conditions': 'Medium IV (45-60) + Slight Bias (0.5-1.5% from SMA, ADX < 15)',
-            'target_pct': '3-5%',
-            'risk_profile': 'Limited risk, combines time decay + directional',
-            'ideal_market': 'Medium volatility, slight directional bias'
-        }
-    }
-    
-    return strategy_info.get(strategy_name, {
-        'description': 'Unknown strategy',
-        'conditions': 'N/A',
-        'target_pct': 'N/A',
-        'risk_profile': 'N/A',
-        'ideal_market': 'N/A'
-    })
+    return _STRATEGY_INFO.get(strategy_name, _UNKNOWN_STRATEGY_INFO)